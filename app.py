@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -7,17 +9,34 @@ import uvicorn
 from src.routes.health_route import router as health_router
 from src.routes.search_route import router as search_router
 from src.routes.index_route import router as index_router
+from src.routes.metrics_route import router as metrics_router
+from src.routes.ready_route import router as ready_router
+from src.agents.workflow.runner import warm_up
 from src.utils.logger import setup_logger
+from src.utils.readiness import readiness
 
 load_dotenv()
 setup_logger()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up the search agent in the background so /health answers immediately
+    warm_up_task = asyncio.create_task(readiness.warm_up(warm_up))
+    yield
+    warm_up_task.cancel()
+
+    from src.agents.components.fetcher import close_shared_client
+
+    await close_shared_client()
+
+
 app = FastAPI(
     title="Search Agent API",
     description="AI-powered search agent",
     version="1.0.0",
     docs_url="/docs",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -32,7 +51,9 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 app.include_router(search_router)
 app.include_router(health_router)
+app.include_router(ready_router)
 app.include_router(index_router)
+app.include_router(metrics_router)
 
 
 if __name__ == "__main__":
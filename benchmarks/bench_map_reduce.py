@@ -0,0 +1,67 @@
+"""
+Compare single-shot and map-reduce summarization on live search results.
+
+Requires GOOGLE_API_KEY (and network access for the DDGS search).
+
+Usage:
+    python -m benchmarks.bench_map_reduce "your query" [runs]
+"""
+
+import asyncio
+import sys
+import time
+
+from dotenv import load_dotenv
+from langchain_core.callbacks import get_usage_metadata_callback
+
+from src.agents.components import ActionExecutor, PlanGenerator, Summarizer
+from src.agents.components.action import format_search_results
+
+
+async def measure(
+    summarizer: Summarizer,
+    query: str,
+    sections: list[str],
+    map_reduce: bool,
+    runs: int,
+) -> None:
+    search_results = "".join(sections)
+    latencies: list[float] = []
+    tokens: list[int] = []
+    statuses: list[str] = []
+
+    for _ in range(runs):
+        with get_usage_metadata_callback() as usage:
+            start = time.perf_counter()
+            response = await summarizer.asummarize(
+                query, search_results, sections, map_reduce=map_reduce
+            )
+            latencies.append(time.perf_counter() - start)
+        tokens.append(sum(u["total_tokens"] for u in usage.usage_metadata.values()))
+        statuses.append(response.status.value)
+
+    label = "map-reduce" if map_reduce else "single-shot"
+    print(
+        f"{label:<12} latency avg {sum(latencies) / runs:6.2f}s "
+        f"min {min(latencies):6.2f}s | tokens avg {sum(tokens) / runs:8.0f} "
+        f"| status {', '.join(statuses)}"
+    )
+
+
+async def main() -> None:
+    load_dotenv()
+    query = sys.argv[1] if len(sys.argv) > 1 else "Latest developments in fusion energy"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    plan = PlanGenerator().generate_plan(query)
+    results = await ActionExecutor(max_results=8).execute_plan(plan.steps)
+    sections = format_search_results(results)
+    print(f"plan steps: {len(plan.steps)}, input: {len(''.join(sections))} chars")
+
+    summarizer = Summarizer()
+    await measure(summarizer, query, sections, map_reduce=False, runs=runs)
+    await measure(summarizer, query, sections, map_reduce=True, runs=runs)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""
+Compare the direct structured-output path with the agent path for the
+PlanGenerator and the Summarizer on a live query.
+
+Reports model round trips, latency and tokens per call. Requires
+GOOGLE_API_KEY (and network access for the DDGS search).
+
+Usage:
+    python -m benchmarks.bench_structured_output "your query" [runs]
+"""
+
+import asyncio
+import sys
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from dotenv import load_dotenv
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+from src.agents.components import ActionExecutor, PlanGenerator, Summarizer
+from src.agents.components.action import format_search_results
+
+
+class CallCounter(UsageMetadataCallbackHandler):
+    """Counts model round trips on top of the token usage."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.calls += 1
+        super().on_llm_end(response, **kwargs)
+
+
+_counter: ContextVar[CallCounter | None] = ContextVar("bench_counter", default=None)
+register_configure_hook(_counter, inheritable=True)
+
+
+async def measure(label: str, call: Callable[[], Awaitable[object]], runs: int) -> None:
+    latencies: list[float] = []
+    calls: list[int] = []
+    tokens: list[int] = []
+
+    for _ in range(runs):
+        counter = CallCounter()
+        token = _counter.set(counter)
+        try:
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+        finally:
+            _counter.reset(token)
+        calls.append(counter.calls)
+        tokens.append(sum(u["total_tokens"] for u in counter.usage_metadata.values()))
+
+    print(
+        f"{label:<20} round trips avg {sum(calls) / runs:4.1f} "
+        f"| latency avg {sum(latencies) / runs:6.2f}s min {min(latencies):6.2f}s "
+        f"| tokens avg {sum(tokens) / runs:8.0f}"
+    )
+
+
+async def main() -> None:
+    load_dotenv()
+    query = sys.argv[1] if len(sys.argv) > 1 else "Latest developments in fusion energy"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    plan = PlanGenerator().generate_plan(query)
+    results = await ActionExecutor().execute_plan(plan.steps)
+    search_results = "".join(format_search_results(results))
+    print(f"plan steps: {len(plan.steps)}, input: {len(search_results)} chars")
+
+    for structured_output in (True, False):
+        path = "direct" if structured_output else "agent"
+        planner = PlanGenerator(structured_output=structured_output)
+        summarizer = Summarizer(structured_output=structured_output)
+        await measure(
+            f"plan/{path}",
+            lambda: asyncio.to_thread(planner.generate_plan, query),
+            runs,
+        )
+        await measure(
+            f"summarize/{path}",
+            lambda: summarizer.asummarize(query, search_results, map_reduce=False),
+            runs,
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
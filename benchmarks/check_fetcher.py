@@ -0,0 +1,284 @@
+"""
+Check PageFetcher against a local stand-in HTTP server.
+
+Covers text extraction, cache freshness and revalidation, the response size
+cap, non-HTML and error responses, redirects, refusal of non-public addresses
+and the fetch deadline. Needs no network access.
+
+Usage:
+    python -m benchmarks.check_fetcher
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from src.agents.components.action import SearchInformation, SearchResult
+from src.agents.components.fetcher import MAX_REDIRECTS, PageCache, PageFetcher
+
+ARTICLE = (
+    b"<html><head><title>t</title><style>p{}</style></head><body>"
+    b"<nav><ul><li>Home<li>About</ul></nav>"
+    b"<header><p>Site menu</header>"
+    b"<main><h1>Fusion record</h1><p>The reactor held plasma for 22 minutes.</p>"
+    b"<aside><p>Related links</aside><p>Results were published today.</p></main>"
+    b"<script>var x = '<p>not text</p>';</script></body></html>"
+)
+MAX_BYTES = 64_000
+# Markup without text, so only the byte cap can stop reading before the end
+PADDING = b"<div class='spacer'></div>"
+
+
+def padded_page(padding_bytes: int) -> bytes:
+    padding = PADDING * (padding_bytes // len(PADDING))
+    return b"<html><body><p>first words</p>" + padding + b"<p>last words</p>"
+
+
+BIG = padded_page(4 * MAX_BYTES)
+UNDER_CAP = padded_page(MAX_BYTES // 2)
+
+
+LAST_MODIFIED = "Mon, 05 Oct 2026 10:00:00 GMT"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    requests: dict[str, int] = {}
+    not_modified = 0
+    port = 0
+
+    def do_GET(self) -> None:
+        StandInHandler.requests[self.path] = (
+            StandInHandler.requests.get(self.path, 0) + 1
+        )
+        if self.path == "/article":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._not_modified()
+                return
+            self._send(
+                200,
+                "text/html; charset=utf-8",
+                ARTICLE,
+                {"ETag": '"v1"', "Cache-Control": "no-cache"},
+            )
+        elif self.path == "/dated":
+            if self.headers.get("If-Modified-Since") == LAST_MODIFIED:
+                self._not_modified()
+                return
+            headers = {"Last-Modified": LAST_MODIFIED, "Cache-Control": "max-age=0"}
+            self._send(200, "text/html", b"<p>dated page</p>", headers)
+        elif self.path == "/fresh":
+            headers = {"Cache-Control": "max-age=60"}
+            self._send(200, "text/html", b"<p>fresh page</p>", headers)
+        elif self.path == "/news":
+            self._send(200, "text/html", b"<p>latest news</p>")
+        elif self.path == "/private":
+            headers = {"Cache-Control": "no-store"}
+            self._send(200, "text/html", b"<p>private page</p>", headers)
+        elif self.path == "/redirect":
+            self._redirect("/news")
+        elif self.path == "/redirect-internal":
+            self._redirect(f"http://localhost:{StandInHandler.port}/news")
+        elif self.path == "/loop":
+            self._redirect("/loop")
+        elif self.path == "/big":
+            self._send(200, "text/html", BIG)
+        elif self.path == "/under-cap":
+            self._send(200, "text/html", UNDER_CAP)
+        elif self.path == "/data.json":
+            self._send(200, "application/json", b'{"a": 1}')
+        elif self.path == "/slow":
+            time.sleep(2)
+            self._send(200, "text/html", b"<p>late</p>")
+        else:
+            self._send(404, "text/html", b"<p>missing</p>")
+
+    def _not_modified(self) -> None:
+        StandInHandler.not_modified += 1
+        self.send_response(304)
+        self.end_headers()
+
+    def _redirect(self, location: str) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(
+        self,
+        status: int,
+        content_type: str,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def result_for(base: str, *paths: str) -> SearchResult:
+    return SearchResult(
+        1,
+        "query",
+        [SearchInformation(p, f"snippet {p}", base + p) for p in paths],
+    )
+
+
+def served(path: str) -> int:
+    return StandInHandler.requests.get(path, 0)
+
+
+async def run_checks(base: str) -> list[tuple[str, bool]]:
+    checks: list[tuple[str, bool]] = []
+    async with httpx.AsyncClient() as client:
+        # The stand-in server is on loopback, which is refused unless allowed
+        fetcher = PageFetcher(
+            max_pages=5,
+            max_bytes=MAX_BYTES,
+            deadline=1.0,
+            client=client,
+            cache=PageCache(),
+            allowed_hosts={"127.0.0.1"},
+        )
+
+        text = await fetcher.fetch(base + "/article") or ""
+        checks.append(("main text extracted", "22 minutes" in text))
+        checks.append(("text after unclosed tags kept", "published today" in text))
+        checks.append(
+            (
+                "nav/header/aside/script skipped",
+                not any(
+                    s in text for s in ("Home", "Site menu", "Related", "not text")
+                ),
+            )
+        )
+
+        again = await fetcher.fetch(base + "/article")
+        checks.append(
+            (
+                "ETag revalidated with 304",
+                again == text and StandInHandler.not_modified == 1,
+            )
+        )
+        dated = await fetcher.fetch(base + "/dated")
+        dated_again = await fetcher.fetch(base + "/dated")
+        checks.append(
+            (
+                "Last-Modified revalidated with 304",
+                dated == dated_again == "dated page"
+                and StandInHandler.not_modified == 2,
+            )
+        )
+        for _ in range(2):
+            await fetcher.fetch(base + "/fresh")
+        checks.append(("max-age page served from cache", served("/fresh") == 1))
+        for _ in range(2):
+            await fetcher.fetch(base + "/private")
+        checks.append(
+            (
+                "no-store page not cached",
+                served("/private") == 2
+                and fetcher.cache.get(base + "/private") is None,
+            )
+        )
+        expiring = PageFetcher(
+            client=client, cache=PageCache(ttl=0), allowed_hosts={"127.0.0.1"}
+        )
+        for _ in range(2):
+            await expiring.fetch(base + "/news")
+        checks.append(
+            ("page without validators refetched after TTL", served("/news") == 2)
+        )
+
+        checks.append(
+            (
+                "byte cap stops reading",
+                "last words" in (await fetcher.fetch(base + "/under-cap") or "")
+                and "last words" not in (await fetcher.fetch(base + "/big") or ""),
+            )
+        )
+
+        checks.append(
+            ("non-HTML skipped", await fetcher.fetch(base + "/data.json") is None)
+        )
+        checks.append(
+            ("HTTP error skipped", await fetcher.fetch(base + "/missing") is None)
+        )
+
+        redirected = await expiring.fetch(base + "/redirect")
+        checks.append(("redirect followed", redirected == "latest news"))
+        internal = await fetcher.fetch(base + "/redirect-internal")
+        checks.append(
+            (
+                "redirect to loopback host refused",
+                internal is None and served("/news") == 3,
+            )
+        )
+        loop = await fetcher.fetch(base + "/loop")
+        checks.append(
+            (
+                "redirect loop stopped",
+                loop is None and served("/loop") == MAX_REDIRECTS + 1,
+            )
+        )
+        default = PageFetcher(client=client, cache=PageCache())
+        checks.append(
+            (
+                "loopback and metadata addresses refused",
+                await default.fetch(base + "/news") is None
+                and await default.fetch("http://169.254.169.254/latest/meta-data/")
+                is None
+                and served("/news") == 3,
+            )
+        )
+
+        results = [result_for(base, "/slow", "/article")]
+        start = time.monotonic()
+        fetched = await fetcher.enrich(results)
+        elapsed = time.monotonic() - start
+        infos = results[0].results
+        checks.append(
+            (
+                "deadline drops slow pages",
+                fetched == 1
+                and elapsed < 1.5
+                and not infos[0].content
+                and bool(infos[1].content),
+            )
+        )
+        checks.append(("host limits released", not fetcher._host_limits))
+    return checks
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    StandInHandler.port = server.server_address[1]
+    base = f"http://127.0.0.1:{StandInHandler.port}"
+    try:
+        checks = asyncio.run(run_checks(base))
+    finally:
+        server.shutdown()
+
+    for name, passed in checks:
+        print(f"{'ok  ' if passed else 'FAIL'} {name}")
+    if not all(passed for _, passed in checks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Import-time profile of the API entry point.
+
+Runs `python -X importtime` on a fresh interpreter and reports the total
+import time plus the most expensive top-level packages, so cold start can be
+tracked from release to release.
+
+Usage:
+    python -m benchmarks.import_profile [module] [--top N] [--json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+
+def profile_imports(module: str) -> dict[str, int]:
+    """Return the import time in microseconds spent in each top-level package."""
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    packages: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    return packages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("module", nargs="?", default="app")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    args = parser.parse_args()
+
+    packages = profile_imports(args.module)
+    total = sum(packages.values())
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+    if args.json:
+        report = {
+            "module": args.module,
+            "python": sys.version.split()[0],
+            "total_ms": round(total / 1000, 1),
+            "packages_ms": {name: round(us / 1000, 1) for name, us in ranked},
+        }
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"import {args.module}: {total / 1000:.1f} ms")
+    for name, us in ranked[: args.top]:
+        print(f"  {name:<32} {us / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,14 @@
 """Search agent package."""
 
-from .workflow import run_search_agent_stream
-from .context import SearchContext
-from .components import PlanGenerator, ActionExecutor, Summarizer
+from src.utils.lazy_exports import lazy_exports
 
-__all__ = [
-    "run_search_agent_stream",
-    "SearchContext",
-    "PlanGenerator",
-    "ActionExecutor",
-    "Summarizer",
-]
+__getattr__, __all__ = lazy_exports(
+    __name__,
+    {
+        "run_search_agent_stream": ".workflow",
+        "SearchContext": ".context",
+        "PlanGenerator": ".components",
+        "ActionExecutor": ".components",
+        "Summarizer": ".components",
+    },
+)
@@ -1,11 +1,15 @@
 """Components package for search agent."""
 
-from .plan import PlanGenerator
-from .action import ActionExecutor
-from .summarizer import Summarizer
+from src.utils.lazy_exports import lazy_exports
 
-__all__ = [
-    "PlanGenerator",
-    "ActionExecutor",
-    "Summarizer",
-]
+__getattr__, __all__ = lazy_exports(
+    __name__,
+    {
+        "PlanGenerator": ".plan",
+        "ActionExecutor": ".action",
+        "Summarizer": ".summarizer",
+        "PageFetcher": ".fetcher",
+        "PassageIndex": ".passage_index",
+        "ModelRouter": ".model_router",
+    },
+)
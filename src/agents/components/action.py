@@ -5,23 +5,25 @@ Action executor for search workflows.
 import logging
 import asyncio
 from dataclasses import dataclass
+from typing import Callable
 from ddgs import DDGS
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchInformation:
     title: str
     body: str
     url: str
+    content: str = ""
 
     def format(self) -> str:
-        return f"[{self.title}]({self.url})\n{self.body}"
+        return f"[{self.title}]({self.url})\n{self.content or self.body}"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     task_number: int
     search_query: str
@@ -37,6 +39,50 @@ class SearchResult:
         return formatted
 
 
+def format_search_results(results: list[SearchResult]) -> list[str]:
+    """Render search results into one section per task for the Summarize stage."""
+
+    return [f"{content}\n" for result in results if (content := result.result_format())]
+
+
+def merge_results(
+    primary: list[SearchResult],
+    extra: list[SearchResult],
+    is_excluded: Callable[[str], bool],
+    max_results: int,
+) -> list[SearchResult]:
+    """
+    Combine two result sets per task without a new search.
+
+    Results whose URL is excluded are dropped and duplicates are skipped, then
+    each task is topped up from `extra` to `max_results` entries.
+    """
+
+    extra_by_task = {result.task_number: result for result in extra}
+    merged: list[SearchResult] = []
+    for result in primary:
+        seen: set[str] = set()
+        infos: list[SearchInformation] = []
+        candidates = list(result.results)
+        if result.task_number in extra_by_task:
+            candidates += extra_by_task[result.task_number].results
+        for info in candidates:
+            if info.url in seen or is_excluded(info.url):
+                continue
+            seen.add(info.url)
+            infos.append(info)
+            if len(infos) >= max_results:
+                break
+        merged.append(
+            SearchResult(
+                task_number=result.task_number,
+                search_query=result.search_query,
+                results=infos,
+            )
+        )
+    return merged
+
+
 class ActionExecutor:
     """Executes search actions from a validated plan."""
 
@@ -50,9 +96,26 @@ class ActionExecutor:
         self.max_results = max_results
 
     async def execute_plan(
-        self, plan: list[str], source_filter: str = ""
+        self,
+        plan: list[str],
+        source_filter: str = "",
+        max_steps: int | None = None,
+        timeout: float | None = None,
+        page: int = 1,
     ) -> list[SearchResult]:
-        """Execute search plan and return results."""
+        """
+        Execute search plan and return results.
+
+        Args:
+            plan: Search queries to run
+            source_filter: DuckDuckGo filter appended to every query
+            max_steps: Run only the first `max_steps` queries of the plan
+            timeout: Seconds to wait for searches; unfinished ones are dropped
+            page: Result page to request from the search engine
+        """
+
+        if max_steps is not None:
+            plan = plan[:max_steps]
 
         tasks: list[tuple[int, str, str]] = []
         for i, query in enumerate(plan, 1):
@@ -66,7 +129,9 @@ class ActionExecutor:
                 logger.debug(
                     f"Executing search task {task_number}: {original_query[:50]}..."
                 )
-                search_result = await asyncio.to_thread(self._search, filtered_query)
+                search_result = await asyncio.to_thread(
+                    self._search, filtered_query, page
+                )
                 logger.debug(
                     f"Task {task_number} completed: {len(search_result)} characters"
                 )
@@ -80,13 +145,18 @@ class ActionExecutor:
                 return None
 
         # Gather all tasks
-        results = await asyncio.gather(
-            *[
+        pending = [
+            asyncio.ensure_future(
                 run_search(task_number, original_query, filtered_query)
-                for task_number, original_query, filtered_query in tasks
-            ],
-            return_exceptions=True,
-        )
+            )
+            for task_number, original_query, filtered_query in tasks
+        ]
+        if timeout is not None and pending:
+            _, late = await asyncio.wait(pending, timeout=max(timeout, 0))
+            for task in late:
+                logger.warning("Search task dropped: deadline reached")
+                task.cancel()
+        results = await asyncio.gather(*pending, return_exceptions=True)
 
         # Filter out exceptions and None results
         valid_results = [
@@ -95,11 +165,11 @@ class ActionExecutor:
         logger.debug(f"Search execution completed: {len(valid_results)} valid results")
         return valid_results
 
-    def _search(self, query: str) -> list[SearchInformation]:
+    def _search(self, query: str, page: int = 1) -> list[SearchInformation]:
         """Perform search using DDGS."""
 
         with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=self.max_results))
+            results = list(ddgs.text(query, max_results=self.max_results, page=page))
 
             if not results:
                 return []
@@ -0,0 +1,95 @@
+"""
+Evidence handed from the Action stage to the Summarizer.
+"""
+
+from urllib.parse import urlsplit
+
+from src.agents.components.action import SearchResult, format_search_results
+from src.agents.components.passage_index import (
+    Passage,
+    format_passages,
+    query_terms,
+    tokenize,
+)
+
+
+class SearchEvidence:
+    """
+    Selected search evidence, rendered to text only when it is needed.
+
+    Holds references to the selected passages (or to the raw results) instead
+    of a rendered copy, so the state carries the result text once.
+    """
+
+    __slots__ = ("passages", "results", "error", "length")
+
+    def __init__(
+        self,
+        passages: list[Passage] | None = None,
+        results: list[SearchResult] | None = None,
+        error: str = "",
+    ):
+        self.passages = passages
+        self.results = results
+        self.error = error
+        self.length = sum(map(len, self.sections()))
+
+    def sections(self) -> list[str]:
+        """Render the evidence as one section per plan step."""
+
+        if self.error:
+            return [self.error]
+        if self.passages is not None:
+            return format_passages(self.passages)
+        return format_search_results(self.results or [])
+
+    def sources(self) -> list[tuple[str, str]]:
+        """Return the (url, text) pairs the evidence is made of."""
+
+        if self.passages is not None:
+            return [(p.url, p.text) for p in self.passages]
+        return [
+            (info.url, info.content or info.body)
+            for result in self.results or []
+            for info in result.results
+        ]
+
+    def is_sufficient(
+        self,
+        query: str,
+        min_sources: int = 3,
+        min_term_sources: int = 2,
+        min_chars: int = 1_500,
+    ) -> bool:
+        """
+        Cheap local check that the evidence clearly covers the query.
+
+        True when the evidence spans at least `min_sources` domains and every
+        query term appears on at least `min_term_sources` of them.
+        """
+
+        if self.error or self.length < min_chars:
+            return False
+        terms = query_terms(query)
+        if not terms:
+            return False
+
+        domains: dict[str, set[str]] = {}
+        for url, text in self.sources():
+            host = urlsplit(url).hostname or url
+            domains.setdefault(host, set()).update(tokenize(text))
+        if len(domains) < min_sources:
+            return False
+        return all(
+            sum(term in tokens for tokens in domains.values()) >= min_term_sources
+            for term in terms
+        )
+
+    def render(self) -> str:
+        return "".join(self.sections())
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        return self.render()
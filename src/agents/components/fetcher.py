@@ -0,0 +1,528 @@
+"""
+Page fetcher for search workflows.
+
+Retrieves result pages through a shared, connection-pooled async HTTP client
+and extracts their main text incrementally while the body is streamed.
+"""
+
+import asyncio
+import codecs
+import ipaddress
+import logging
+import re
+import socket
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Collection, Mapping
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.agents.components.action import SearchInformation, SearchResult
+
+logger = logging.getLogger(__name__)
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; search-agent/0.1)"
+
+# Redirects followed per page; each hop is checked like the first URL
+MAX_REDIRECTS = 5
+
+# Subtrees that never hold the main text of a page
+SKIPPED_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "template",
+        "svg",
+        "nav",
+        "header",
+        "footer",
+        "aside",
+        "form",
+        "iframe",
+    }
+)
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "main",
+        "li",
+        "ul",
+        "ol",
+        "table",
+        "tr",
+        "td",
+        "th",
+        "blockquote",
+        "pre",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "br",
+    }
+)
+
+_WHITESPACE = re.compile(r"\s+")
+_CHARSET = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+
+class TextExtractor(HTMLParser):
+    """Streaming HTML to text extractor.
+
+    Chunks are fed as they arrive, so only the extracted text is kept in
+    memory rather than the whole document tree.
+    """
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.length = 0
+        # Root tag of the subtree being skipped and how often it is open, so
+        # omitted end tags inside it (e.g. </li>, </p>) do not matter
+        self._skip_tag: str | None = None
+        self._skip_open = 0
+        self._blocks: list[str] = []
+        self._current: list[str] = []
+
+    @property
+    def is_full(self) -> bool:
+        return self.length >= self.max_chars
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in VOID_TAGS:
+            if tag in BLOCK_TAGS:
+                self._end_block()
+            return
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_open += 1
+        elif tag in SKIPPED_TAGS:
+            self._skip_tag = tag
+            self._skip_open = 1
+        elif tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in VOID_TAGS:
+            return
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_open -= 1
+                if not self._skip_open:
+                    self._skip_tag = None
+        elif tag in BLOCK_TAGS:
+            self._end_block()
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_tag is not None or self.is_full:
+            return
+        self._current.append(data)
+
+    def _end_block(self) -> None:
+        if not self._current:
+            return
+        block = _WHITESPACE.sub(" ", "".join(self._current)).strip()
+        self._current.clear()
+        if not block or self.is_full:
+            return
+        block = block[: self.max_chars - self.length]
+        self._blocks.append(block)
+        self.length += len(block) + 1
+
+    def text(self) -> str:
+        self._end_block()
+        return "\n".join(self._blocks)
+
+
+def is_public_address(address: str) -> bool:
+    """True for globally routable unicast addresses.
+
+    Loopback, private, link-local (including cloud metadata endpoints such as
+    169.254.169.254), shared and reserved addresses are not public.
+    """
+
+    try:
+        ip = ipaddress.ip_address(address.split("%", 1)[0])
+    except ValueError:
+        return False
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def cache_lifetime(headers: Mapping[str, str], default: float) -> float | None:
+    """
+    Seconds a response may be served from the cache without revalidation.
+
+    Returns None when the response must not be stored (`no-store`).
+    """
+
+    lifetime = default
+    for directive in headers.get("cache-control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            lifetime = 0.0
+        elif name == "max-age" and value.strip('"').isdigit():
+            lifetime = float(value.strip('"'))
+    return lifetime
+
+
+@dataclass(slots=True)
+class CachedPage:
+    text: str
+    expires: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating the page."""
+
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """LRU cache of extracted page text keyed by URL."""
+
+    def __init__(self, max_entries: int = 512, ttl: float = 300.0):
+        """
+        Initialize PageCache.
+
+        Args:
+            max_entries: Pages kept before the least recently used is evicted
+                (default: 512)
+            ttl: Seconds a page without `Cache-Control: max-age` is served
+                before it is revalidated or fetched again (default: 300)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._pages: OrderedDict[str, CachedPage] = OrderedDict()
+
+    def get(self, url: str) -> CachedPage | None:
+        page = self._pages.get(url)
+        if page is not None:
+            self._pages.move_to_end(url)
+        return page
+
+    def put(self, url: str, page: CachedPage) -> None:
+        self._pages[url] = page
+        self._pages.move_to_end(url)
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+
+
+_shared_client: httpx.AsyncClient | None = None
+_shared_cache = PageCache()
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # Redirects are followed by PageFetcher, which checks every hop
+        _shared_client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+class PageFetcher:
+    """Fetches the top search result pages and extracts their main text."""
+
+    def __init__(
+        self,
+        max_pages: int = 4,
+        max_bytes: int = 512_000,
+        max_chars: int = 6_000,
+        per_host_limit: int = 2,
+        timeout: float = 5.0,
+        deadline: float = 8.0,
+        client: httpx.AsyncClient | None = None,
+        cache: PageCache | None = None,
+        allowed_hosts: Collection[str] = (),
+    ):
+        """
+        Initialize PageFetcher.
+
+        Args:
+            max_pages: Number of result URLs to fetch per run (default: 4)
+            max_bytes: Maximum bytes read from a single response (default: 512000)
+            max_chars: Maximum extracted characters kept per page (default: 6000)
+            per_host_limit: Concurrent requests allowed per host (default: 2)
+            timeout: Per-request network timeout in seconds (default: 5.0)
+            deadline: Overall time budget for a fetch round in seconds (default: 8.0)
+            client: HTTP client to use instead of the shared pooled client
+            cache: Page cache to use instead of the shared cache
+            allowed_hosts: Host names fetched even though they resolve to a
+                non-public address; all others must resolve to public ones
+        """
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.deadline = deadline
+        self._client = client
+        self.cache = cache if cache is not None else _shared_cache
+        self.allowed_hosts = frozenset(allowed_hosts)
+        # Per-host semaphores live only while requests to the host are active
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._host_users: dict[str, int] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client if self._client is not None else get_shared_client()
+
+    async def enrich(
+        self, results: list[SearchResult], deadline: float | None = None
+    ) -> int:
+        """
+        Fetch the top result pages and store their text on the results.
+
+        Pages that fail, are not HTML or miss the deadline keep their snippet.
+
+        Args:
+            results: Search results from the Action stage
+            deadline: Time budget in seconds, overriding the configured one
+
+        Returns:
+            Number of pages whose content was filled in
+        """
+
+        targets = self._select_targets(results)
+        if not targets:
+            return 0
+
+        budget = self.deadline if deadline is None else min(deadline, self.deadline)
+        tasks = {
+            asyncio.create_task(self.fetch(url)): infos
+            for url, infos in targets.items()
+        }
+        done, pending = await asyncio.wait(tasks, timeout=max(budget, 0))
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let the cancelled fetches close their connections and host slots
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.debug(f"Page fetch deadline reached: {len(pending)} pages dropped")
+
+        fetched = 0
+        for task in done:
+            if task.cancelled() or task.exception() is not None:
+                continue
+            text = task.result()
+            if not text:
+                continue
+            for info in tasks[task]:
+                info.content = text
+            fetched += 1
+        return fetched
+
+    def _select_targets(
+        self, results: list[SearchResult]
+    ) -> dict[str, list[SearchInformation]]:
+        """Pick the top URLs, taking results rank by rank across tasks."""
+
+        targets: dict[str, list[SearchInformation]] = {}
+        depth = max((len(r.results) for r in results), default=0)
+        for rank in range(depth):
+            for result in results:
+                if rank >= len(result.results):
+                    continue
+                info = result.results[rank]
+                if not info.url.startswith(("http://", "https://")):
+                    continue
+                if info.url in targets:
+                    targets[info.url].append(info)
+                elif len(targets) < self.max_pages:
+                    targets[info.url] = [info]
+        return targets
+
+    async def fetch(self, url: str) -> str | None:
+        """
+        Fetch one page and return its extracted text, using the cache.
+
+        Redirects are followed here rather than by the client, so that every
+        hop is refused unless its host resolves to public addresses only.
+        """
+
+        cached = self.cache.get(url)
+        if cached is not None and cached.is_fresh:
+            return cached.text
+
+        headers = cached.validators() if cached is not None else {}
+        target = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                if not await self._is_allowed(target):
+                    logger.warning(f"Refusing to fetch non-public address: {target}")
+                    return None
+
+                async with self._host_slot(urlsplit(target).hostname or ""):
+                    async with self.client.stream(
+                        "GET",
+                        target,
+                        headers=headers,
+                        timeout=self.timeout,
+                        follow_redirects=False,
+                    ) as response:
+                        if response.has_redirect_location:
+                            target = str(
+                                response.url.join(response.headers["location"])
+                            )
+                            continue
+                        return await self._read(url, response, cached)
+        except httpx.HTTPError as e:
+            logger.debug(f"Page fetch failed for {url}: {e}")
+            return None
+
+        logger.debug(f"Page fetch {url}: more than {MAX_REDIRECTS} redirects")
+        return None
+
+    async def _read(
+        self, url: str, response: httpx.Response, cached: CachedPage | None
+    ) -> str | None:
+        """Extract the final response of a fetch and update the cache."""
+
+        lifetime = cache_lifetime(response.headers, self.cache.ttl)
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Page not modified: {url}")
+            cached.expires = time.monotonic() + (lifetime or 0.0)
+            cached.etag = response.headers.get("etag", cached.etag)
+            return cached.text
+        if response.status_code != 200:
+            logger.debug(f"Page fetch {url}: HTTP {response.status_code}")
+            return None
+
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type:
+            logger.debug(f"Skipping non-HTML page {url}: {content_type}")
+            return None
+
+        text = await self._extract(response, content_type)
+        if text and lifetime is not None:
+            page = CachedPage(
+                text=text,
+                expires=time.monotonic() + lifetime,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+            self.cache.put(url, page)
+        return text or None
+
+    async def _is_allowed(self, url: str) -> bool:
+        """Check that the URL's host resolves to public addresses only."""
+
+        parts = urlsplit(url)
+        host = parts.hostname
+        if parts.scheme not in ("http", "https") or not host:
+            return False
+        if host in self.allowed_hosts:
+            return True
+        try:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+        except (OSError, ValueError):
+            return False
+        # The client resolves the host again when connecting; a name re-pointed
+        # within that window (DNS rebinding) is not caught by this check
+        return bool(infos) and all(is_public_address(info[4][0]) for info in infos)
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str):
+        """Hold one of the host's request slots."""
+
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        self._host_users[host] = self._host_users.get(host, 0) + 1
+        try:
+            async with limit:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            if not self._host_users[host]:
+                del self._host_users[host]
+                del self._host_limits[host]
+
+    async def _extract(self, response: httpx.Response, content_type: str) -> str:
+        """Feed the streamed body into the extractor up to the size cap."""
+
+        match = _CHARSET.search(content_type)
+        try:
+            decoder = codecs.getincrementaldecoder(match.group(1) if match else "utf-8")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")
+        decode = decoder(errors="replace").decode
+
+        extractor = TextExtractor(self.max_chars)
+        received = 0
+        async for chunk in response.aiter_bytes():
+            chunk = chunk[: self.max_bytes - received]
+            received += len(chunk)
+            extractor.feed(decode(chunk))
+            if received >= self.max_bytes or extractor.is_full:
+                break
+        extractor.feed(decode(b"", final=True))
+        extractor.close()
+        return extractor.text()
+
+
+__all__ = [
+    "PageFetcher",
+    "PageCache",
+    "TextExtractor",
+    "is_public_address",
+    "get_shared_client",
+    "close_shared_client",
+]
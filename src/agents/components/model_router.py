@@ -0,0 +1,187 @@
+"""
+Model routing for search workflow components.
+
+Picks the model for each call from the input size and the attempt number,
+escalating to a stronger model only on retries, and steers away from models
+whose recent calls were failing or slow.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ModelTier:
+    model: str
+    temperature: float
+    # Inputs longer than this go to the next tier (None: no limit)
+    max_input_chars: int | None = None
+
+
+# Cheapest first; each retry moves one tier up
+SUMMARY_TIERS = (
+    ModelTier("gemini-2.0-flash-lite", temperature=0.5, max_input_chars=24_000),
+    ModelTier("gemini-2.0-flash", temperature=0.5),
+)
+
+
+class ModelStats:
+    """Rolling window of call latencies and outcomes for one model."""
+
+    def __init__(self, max_samples: int = 50, window_seconds: float = 300.0):
+        self.window_seconds = window_seconds
+        self._samples: deque[tuple[float, float, bool]] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._samples.append((time.monotonic(), seconds, ok))
+
+    def snapshot(self) -> tuple[int, float, float]:
+        """Return (samples, error rate, mean latency) over the window."""
+
+        cutoff = time.monotonic() - self.window_seconds
+        with self._lock:
+            while self._samples and self._samples[0][0] < cutoff:
+                self._samples.popleft()
+            samples = list(self._samples)
+        if not samples:
+            return 0, 0.0, 0.0
+        errors = sum(1 for _, _, ok in samples if not ok)
+        latency = sum(seconds for _, seconds, _ in samples) / len(samples)
+        return len(samples), errors / len(samples), latency
+
+
+class ModelRouter:
+    """Chooses a model tier per call and tracks how each model is doing."""
+
+    def __init__(
+        self,
+        tiers: tuple[ModelTier, ...] = SUMMARY_TIERS,
+        max_error_rate: float = 0.5,
+        max_latency: float = 30.0,
+        min_samples: int = 5,
+    ):
+        """
+        Initialize ModelRouter.
+
+        Args:
+            tiers: Model tiers, cheapest first
+            max_error_rate: Recent error rate above which a model is avoided
+                (default: 0.5)
+            max_latency: Recent mean latency in seconds above which a model is
+                avoided (default: 30.0)
+            min_samples: Calls needed in the window before a model can be
+                judged (default: 5)
+        """
+        if not tiers:
+            raise ValueError("ModelRouter needs at least one tier")
+        self.tiers = tiers
+        self.max_error_rate = max_error_rate
+        self.max_latency = max_latency
+        self.min_samples = min_samples
+        self.stats = {tier.model: ModelStats() for tier in tiers}
+
+    def select(self, input_length: int, attempt: int = 1) -> ModelTier:
+        """
+        Pick the tier for a call.
+
+        The cheapest tier that fits the input is used on the first attempt and
+        each retry escalates one tier. Unhealthy models are skipped, stronger
+        tiers first.
+        """
+
+        base = next(
+            (
+                i
+                for i, tier in enumerate(self.tiers)
+                if tier.max_input_chars is None or input_length <= tier.max_input_chars
+            ),
+            len(self.tiers) - 1,
+        )
+        preferred = min(base + max(attempt - 1, 0), len(self.tiers) - 1)
+        candidates = [
+            *range(preferred, len(self.tiers)),
+            *range(preferred - 1, -1, -1),
+        ]
+        for i in candidates:
+            if self.is_healthy(self.tiers[i].model):
+                if i != preferred:
+                    logger.info(
+                        f"Routing around {self.tiers[preferred].model} "
+                        f"to {self.tiers[i].model}"
+                    )
+                return self.tiers[i]
+        return self.tiers[preferred]
+
+    def is_healthy(self, model: str) -> bool:
+        samples, error_rate, latency = self.stats[model].snapshot()
+        if samples < self.min_samples:
+            return True
+        return error_rate <= self.max_error_rate and latency <= self.max_latency
+
+    @contextmanager
+    def track(self, model: str) -> Iterator[None]:
+        """
+        Record the latency and outcome of a call to `model`.
+
+        Failed calls count as errors. Calls cancelled by a deadline are the
+        slow ones, so the time they took still counts as a latency sample,
+        but not as an error.
+        """
+
+        start = time.monotonic()
+        try:
+            yield
+        except asyncio.CancelledError:
+            metrics.increment(f"model.{model}.cancelled")
+            self._record(model, start, ok=True)
+            raise
+        except Exception:
+            self._record(model, start, ok=False)
+            raise
+        self._record(model, start, ok=True)
+
+    def _record(self, model: str, start: float, ok: bool) -> None:
+        seconds = time.monotonic() - start
+        self.stats[model].observe(seconds, ok)
+        metrics.observe(f"model.{model}.seconds", seconds)
+        if not ok:
+            metrics.increment(f"model.{model}.errors")
+
+
+_summary_router: ModelRouter | None = None
+_summary_router_lock = threading.Lock()
+
+
+def get_summary_router() -> ModelRouter:
+    """Return the process-wide router over SUMMARY_TIERS.
+
+    Every graph shares it, so each model's health is judged from all of the
+    process's calls rather than per graph.
+    """
+
+    global _summary_router
+    with _summary_router_lock:
+        if _summary_router is None:
+            _summary_router = ModelRouter(SUMMARY_TIERS)
+        return _summary_router
+
+
+__all__ = [
+    "ModelRouter",
+    "ModelStats",
+    "ModelTier",
+    "SUMMARY_TIERS",
+    "get_summary_router",
+]
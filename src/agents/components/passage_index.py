@@ -0,0 +1,182 @@
+"""
+Passage index for evidence selection.
+
+Chunks search results into passages and ranks them with BM25 over an inverted
+index, so only the most relevant evidence reaches the Summarizer.
+"""
+
+import heapq
+import math
+import string
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from src.agents.components.action import SearchResult
+
+
+# Punctuation is mapped to spaces so tokenizing is a C-level translate + split
+_SEPARATORS = str.maketrans(
+    {c: " " for c in string.punctuation + "\u2018\u2019\u201c\u201d\u2013\u2014\u2026"}
+)
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or "
+    "that the this to was were what when where which who why will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return text.lower().translate(_SEPARATORS).split()
+
+
+def query_terms(query: str) -> Counter[str]:
+    """Tokenize a query, dropping stopwords that carry no ranking signal."""
+
+    return Counter(t for t in tokenize(query) if t not in STOPWORDS)
+
+
+def chunk_text(text: str, max_words: int = 80, overlap: int = 20) -> list[str]:
+    """Split text into overlapping windows of at most `max_words` words."""
+
+    words = text.split()
+    if len(words) <= max_words:
+        return [" ".join(words)] if words else []
+
+    step = max(max_words - overlap, 1)
+    chunks: list[str] = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start : start + max_words]))
+        if start + max_words >= len(words):
+            break
+    return chunks
+
+
+@dataclass(slots=True)
+class Passage:
+    text: str
+    title: str
+    url: str
+    task_number: int
+    search_query: str
+    position: int = 0
+
+
+class PassageIndex:
+    """BM25 index over passages.
+
+    Every term maps to the ids of the passages it occurs in, one entry per
+    occurrence, so adding a passage is a single append per token and a query
+    only touches the posting lists of its own terms.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.passages: list[Passage] = []
+        self._lengths = array("I")
+        self._postings: defaultdict[str, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self.passages)
+
+    @classmethod
+    def from_results(
+        cls, results: list[SearchResult], max_words: int = 80, overlap: int = 20
+    ) -> "PassageIndex":
+        """Chunk every result's page text (or snippet) and index the passages."""
+
+        index = cls()
+        for result in results:
+            for info in result.results:
+                chunks = chunk_text(info.content or info.body, max_words, overlap)
+                for position, chunk in enumerate(chunks):
+                    index.add(
+                        Passage(
+                            text=chunk,
+                            title=info.title,
+                            url=info.url,
+                            task_number=result.task_number,
+                            search_query=result.search_query,
+                            position=position,
+                        )
+                    )
+        return index
+
+    def add(self, passage: Passage) -> None:
+        doc_id = len(self.passages)
+        tokens = tokenize(passage.text)
+        self.passages.append(passage)
+        self._lengths.append(len(tokens))
+        postings = self._postings
+        for term in tokens:
+            postings[term].append(doc_id)
+
+    def postings(self, term: str) -> Counter[int]:
+        """Return the term frequency of a term per passage id."""
+
+        return Counter(self._postings.get(term, ()))
+
+    def scores(self, query: str) -> list[float]:
+        """Return the BM25 score of every passage for the query."""
+
+        count = len(self.passages)
+        scores = [0.0] * count
+        if not count:
+            return scores
+
+        k1 = self.k1
+        avg_length = (sum(self._lengths) / count) or 1.0
+        norms = [
+            k1 * (1 - self.b + self.b * length / avg_length) for length in self._lengths
+        ]
+
+        for term, weight in query_terms(query).items():
+            term_freqs = self.postings(term)
+            if not term_freqs:
+                continue
+            df = len(term_freqs)
+            idf = weight * math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for doc_id, tf in term_freqs.items():
+                scores[doc_id] += idf * tf * (k1 + 1) / (tf + norms[doc_id])
+        return scores
+
+    def top(self, query: str, k: int) -> list[Passage]:
+        """Return the `k` highest scoring passages, best first."""
+
+        scores = self.scores(query)
+        best = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        return [self.passages[i] for i in best]
+
+
+def format_passages(passages: list[Passage]) -> list[str]:
+    """Render selected passages into one section per task, keeping URLs."""
+
+    tasks: dict[int, dict[str, list[Passage]]] = {}
+    for passage in passages:
+        tasks.setdefault(passage.task_number, {}).setdefault(passage.url, []).append(
+            passage
+        )
+
+    sections: list[str] = []
+    for task_number in sorted(tasks):
+        sources = tasks[task_number]
+        first = next(iter(sources.values()))[0]
+        formatted = f"**Query: {first.search_query}**\n\n"
+        for i, (url, source_passages) in enumerate(sources.items(), 1):
+            source_passages.sort(key=lambda p: p.position)
+            text = " … ".join(p.text for p in source_passages)
+            title = source_passages[0].title
+            formatted += f"{i}. [{title}]({url})\n{text}\n\n"
+        sections.append(formatted + "\n")
+    return sections
+
+
+__all__ = [
+    "Passage",
+    "PassageIndex",
+    "chunk_text",
+    "format_passages",
+    "query_terms",
+    "tokenize",
+]
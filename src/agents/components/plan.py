@@ -10,6 +10,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.agents.error import NoInputError
 from src.agents.components.prompt.plan import PLAN_PROMPT
+from src.agents.components.structured import StructuredCall
 
 logger = logging.getLogger(__name__)
 
@@ -21,23 +22,50 @@ class PlanResponse(BaseModel):
 class PlanGenerator:
     """Generates search plans."""
 
-    def __init__(self):
+    def __init__(self, structured_output: bool = True):
+        """
+        Initialize PlanGenerator.
+
+        Args:
+            structured_output: Call the model once with native structured
+                output, using the agent only when the reply does not parse
+                (default: True)
+        """
         self.llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash", temperature=0.7)
         self.agent = create_agent(model=self.llm, response_format=PlanResponse)
+        self.structured = (
+            StructuredCall(self.llm, PlanResponse, self.agent, "plan")
+            if structured_output
+            else None
+        )
 
     def generate_plan(self, user_query: str) -> PlanResponse:
         """Generate a search plan for the given query."""
 
-        if not user_query.strip():
-            raise NoInputError()
+        messages = self._messages(user_query)
+        if self.structured is not None:
+            return self.structured.invoke(messages)
 
-        response = self.agent.invoke(
-            {
-                "messages": [
-                    SystemMessage(content=PLAN_PROMPT),
-                    HumanMessage(content=user_query),
-                ]
-            }
-        )
+        response = self.agent.invoke({"messages": messages})
+        content: PlanResponse = response["structured_response"]
+        return content
+
+    async def agenerate_plan(self, user_query: str) -> PlanResponse:
+        """Generate a search plan; cancelling it also cancels the model call."""
+
+        messages = self._messages(user_query)
+        if self.structured is not None:
+            return await self.structured.ainvoke(messages)
+
+        response = await self.agent.ainvoke({"messages": messages})
         content: PlanResponse = response["structured_response"]
         return content
+
+    def _messages(self, user_query: str) -> list[SystemMessage | HumanMessage]:
+        if not user_query.strip():
+            raise NoInputError()
+
+        return [
+            SystemMessage(content=PLAN_PROMPT),
+            HumanMessage(content=user_query),
+        ]
@@ -22,3 +22,26 @@ Search Results:
 
 Please synthesize these results into a comprehensive answer and validate its quality.""",
 )
+
+PARTIAL_SUMMARY_PROMPT = PromptTemplate.from_template(
+    template="""User Query: {user_query}
+
+Search Results for one part of the research plan:
+{search_results}
+
+Extract the facts from these results that help answer the user's query as concise bullet notes.
+- Keep the source URL next to every fact
+- Note any source that looks unreliable (outdated, spam, commercial only, obvious bias)
+- Do not answer the query itself; another step combines the notes""",
+)
+
+ANSWER_PROMPT = PromptTemplate.from_template(
+    template="""User Query: {user_query}
+
+Search Results:
+{search_results}
+
+Synthesize these results into a comprehensive answer to the user's query.
+- Base every statement on the search results
+- Cite the source URL for the key facts""",
+)
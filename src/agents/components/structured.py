@@ -0,0 +1,79 @@
+"""
+Direct structured-output calls for single-completion components.
+
+The model is called once with native JSON-schema output; when the reply does
+not parse into the schema, the component falls back to its agent path.
+"""
+
+import logging
+from typing import TypeVar
+
+from pydantic import BaseModel
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable
+
+from src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+class StructuredCall:
+    """One model call returning `schema`, falling back to an agent on parse failure.
+
+    `system_prompt` is the agent's own system prompt, which the direct call
+    has to send itself.
+    """
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        schema: type[ResponseT],
+        agent: Runnable,
+        name: str,
+        system_prompt: str | None = None,
+    ):
+        self.schema = schema
+        self.agent = agent
+        self.name = name
+        self.system_prompt = system_prompt
+        self.llm = llm.with_structured_output(
+            schema, method="json_schema", include_raw=True
+        )
+
+    def invoke(self, messages: list[BaseMessage]) -> ResponseT:
+        parsed = self._parse(self.llm.invoke(self._direct_messages(messages)))
+        if parsed is not None:
+            return parsed
+        response = self.agent.invoke({"messages": messages})
+        return response["structured_response"]
+
+    async def ainvoke(self, messages: list[BaseMessage]) -> ResponseT:
+        parsed = self._parse(await self.llm.ainvoke(self._direct_messages(messages)))
+        if parsed is not None:
+            return parsed
+        response = await self.agent.ainvoke({"messages": messages})
+        return response["structured_response"]
+
+    def _direct_messages(self, messages: list[BaseMessage]) -> list[BaseMessage]:
+        if self.system_prompt is None:
+            return messages
+        return [SystemMessage(self.system_prompt), *messages]
+
+    def _parse(self, output: dict) -> ResponseT | None:
+        parsed = output.get("parsed")
+        if output.get("parsing_error") is None and isinstance(parsed, self.schema):
+            metrics.increment(f"structured_output.{self.name}.direct")
+            return parsed
+
+        logger.warning(
+            f"Structured output for {self.name} did not parse, "
+            f"falling back to the agent: {output.get('parsing_error')}"
+        )
+        metrics.increment(f"structured_output.{self.name}.fallback")
+        return None
+
+
+__all__ = ["StructuredCall"]
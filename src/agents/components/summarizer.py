@@ -4,18 +4,29 @@ Summarize stage of the search agent workflow.
 Validates the response against user requirements and checks source validity.
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
 from langchain.agents import create_agent
+from langchain_core.runnables import Runnable
 
 from src.agents.error import NoSearchResultError
 from src.utils import ValidationStatus
 from src.agents.components.prompt.summarizer import (
     SUMMARIZE_SYSTEM_PROMPT,
     SYNTHESIS_PROMPT,
+    PARTIAL_SUMMARY_PROMPT,
+    ANSWER_PROMPT,
 )
+from src.agents.components.model_router import (
+    ModelRouter,
+    ModelTier,
+    get_summary_router,
+)
+from src.agents.components.structured import StructuredCall
 
 logger = logging.getLogger(__name__)
 
@@ -28,24 +39,79 @@ class SummarizationResponse(BaseModel):
     )
 
 
+@dataclass(slots=True)
+class SummaryModel:
+    """Model handles for one routing tier."""
+
+    llm: ChatGoogleGenerativeAI
+    agent: Runnable
+    structured: StructuredCall | None
+
+
 class Summarizer:
     """Synthesizes search results and validates response quality."""
 
-    def __init__(self):
-        llm_model = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash-lite",
-            temperature=0.5,
-        )
-        self.agent = create_agent(
-            model=llm_model,
-            system_prompt=SUMMARIZE_SYSTEM_PROMPT,
-            response_format=SummarizationResponse,
-        )
+    def __init__(
+        self,
+        map_reduce_threshold: int = 12_000,
+        max_concurrency: int = 4,
+        structured_output: bool = True,
+        router: ModelRouter | None = None,
+    ):
+        """
+        Initialize Summarizer.
+
+        Args:
+            map_reduce_threshold: Input size in characters above which results
+                are summarized per task before the final call (default: 12000)
+            max_concurrency: Maximum concurrent partial summaries (default: 4)
+            structured_output: Call the model once with native structured
+                output, using the agent only when the reply does not parse
+                (default: True)
+            router: Picks the model per call (default: the process-wide
+                router over SUMMARY_TIERS)
+        """
+        self.map_reduce_threshold = map_reduce_threshold
+        self.max_concurrency = max_concurrency
+        self.structured_output = structured_output
+        self.router = router if router is not None else get_summary_router()
+        self._models: dict[str, SummaryModel] = {}
+
+        default = self.model(self.router.tiers[0])
+        self.llm = default.llm
+        self.agent = default.agent
+        self.structured = default.structured
+
+    def model(self, tier: ModelTier) -> SummaryModel:
+        """Return the model handles for a tier, creating them on first use."""
+
+        model = self._models.get(tier.model)
+        if model is None:
+            llm = ChatGoogleGenerativeAI(model=tier.model, temperature=tier.temperature)
+            agent = create_agent(
+                model=llm,
+                system_prompt=SUMMARIZE_SYSTEM_PROMPT,
+                response_format=SummarizationResponse,
+            )
+            structured = (
+                StructuredCall(
+                    llm,
+                    SummarizationResponse,
+                    agent,
+                    "summarize",
+                    system_prompt=SUMMARIZE_SYSTEM_PROMPT,
+                )
+                if self.structured_output
+                else None
+            )
+            model = self._models[tier.model] = SummaryModel(llm, agent, structured)
+        return model
 
     def summarize(
         self,
         user_query: str,
         search_results: str,
+        attempt: int = 1,
     ) -> SummarizationResponse:
         """
         Synthesize search results and validate.
@@ -53,6 +119,7 @@ class Summarizer:
         Args:
             user_query: The original user query
             search_results: The search results from Action stage
+            attempt: Search attempt number, stronger models are used on retries
         """
 
         logger.debug(f"Starting summarization for query: {user_query[:100]}...")
@@ -64,16 +131,132 @@ class Summarizer:
         synthesis_prompt = SYNTHESIS_PROMPT.format(
             user_query=user_query, search_results=search_results
         )
-        response = self.agent.invoke({"messages": [HumanMessage(synthesis_prompt)]})
-        content: SummarizationResponse = response["structured_response"]
+        tier = self.router.select(len(synthesis_prompt), attempt)
+        model = self.model(tier)
+        with self.router.track(tier.model):
+            if model.structured is not None:
+                content = model.structured.invoke([HumanMessage(synthesis_prompt)])
+            else:
+                response = model.agent.invoke(
+                    {"messages": [HumanMessage(synthesis_prompt)]}
+                )
+                content: SummarizationResponse = response["structured_response"]
+        self._log_result(content, tier)
+        return content
+
+    def uses_map_reduce(self, search_results: str, sections: list[str]) -> bool:
+        """Whether the input is large enough to be summarized per task first."""
+
+        return len(sections) > 1 and len(search_results) > self.map_reduce_threshold
+
+    async def asummarize(
+        self,
+        user_query: str,
+        search_results: str,
+        sections: list[str] | None = None,
+        map_reduce: bool | None = None,
+        attempt: int = 1,
+        validate: bool = True,
+    ) -> SummarizationResponse:
+        """
+        Synthesize search results and validate, switching to map-reduce for
+        large inputs.
+
+        Args:
+            user_query: The original user query
+            search_results: The search results from Action stage
+            sections: The same results split per task, used for map-reduce
+            map_reduce: Force map-reduce on or off instead of deciding by size
+            attempt: Search attempt number, stronger models are used on retries
+            validate: Validate the answer with the model; when False the
+                evidence was judged sufficient and only the answer is written
+        """
 
+        logger.debug(f"Starting summarization for query: {user_query[:100]}...")
+
+        if not search_results.strip():
+            logger.warning("Empty search results provided")
+            raise NoSearchResultError()
+
+        if map_reduce is None:
+            map_reduce = bool(sections) and self.uses_map_reduce(
+                search_results, sections
+            )
+        if map_reduce and sections:
+            search_results = await self._map_sections(user_query, sections)
+
+        if not validate:
+            return await self._answer(user_query, search_results, attempt)
+
+        synthesis_prompt = SYNTHESIS_PROMPT.format(
+            user_query=user_query, search_results=search_results
+        )
+        tier = self.router.select(len(synthesis_prompt), attempt)
+        model = self.model(tier)
+        with self.router.track(tier.model):
+            if model.structured is not None:
+                content = await model.structured.ainvoke(
+                    [HumanMessage(synthesis_prompt)]
+                )
+            else:
+                response = await model.agent.ainvoke(
+                    {"messages": [HumanMessage(synthesis_prompt)]}
+                )
+                content: SummarizationResponse = response["structured_response"]
+        self._log_result(content, tier)
+        return content
+
+    async def _answer(
+        self, user_query: str, search_results: str, attempt: int
+    ) -> SummarizationResponse:
+        """Write the answer as plain text, without the validation step."""
+
+        prompt = ANSWER_PROMPT.format(
+            user_query=user_query, search_results=search_results
+        )
+        tier = self.router.select(len(prompt), attempt)
+        with self.router.track(tier.model):
+            response = await self.model(tier).llm.ainvoke([HumanMessage(prompt)])
+        content = SummarizationResponse(
+            status=ValidationStatus.VALID, summary=response.text
+        )
+        self._log_result(content, tier)
+        return content
+
+    async def _map_sections(self, user_query: str, sections: list[str]) -> str:
+        """Summarize each section concurrently into source-cited notes."""
+
+        logger.debug(f"Map-reduce summarization over {len(sections)} sections")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def summarize_section(section: str) -> str:
+            prompt = PARTIAL_SUMMARY_PROMPT.format(
+                user_query=user_query, search_results=section
+            )
+            try:
+                async with semaphore:
+                    # Partial summaries are routed like first attempts
+                    tier = self.router.select(len(prompt))
+                    with self.router.track(tier.model):
+                        llm = self.model(tier).llm
+                        response = await llm.ainvoke([HumanMessage(prompt)])
+                return response.text
+            except Exception as e:
+                # Fall back to the raw section so its evidence is not lost
+                logger.warning(f"Partial summary failed, using raw results: {e}")
+                return section
+
+        notes = await asyncio.gather(*map(summarize_section, sections))
+        return "\n\n".join(
+            f"Notes for part {i}:\n{note}" for i, note in enumerate(notes, 1)
+        )
+
+    def _log_result(self, content: SummarizationResponse, tier: ModelTier) -> None:
         is_valid = content.status == ValidationStatus.VALID
         flagged_sources = content.flagged_sources
 
         logger.debug(
-            f"Summarization complete: valid={is_valid}, "
+            f"Summarization complete: model={tier.model}, valid={is_valid}, "
             f"flagged_sources={len(flagged_sources)}, "
             f"content_length={len(content.summary)}"
         )
-
-        return content
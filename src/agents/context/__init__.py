@@ -1,8 +1,10 @@
 """Context management package for search workflows."""
 
 from .state import SearchContext, SearchMetadata
+from .execution_log import ExecutionLog
 
 __all__ = [
     "SearchContext",
     "SearchMetadata",
+    "ExecutionLog",
 ]
@@ -0,0 +1,31 @@
+"""
+Execution log data structures.
+"""
+
+from collections import deque
+
+
+class ExecutionLog(deque):
+    """Execution log that retains only the latest entries.
+
+    `total` counts every entry ever appended, so readers can ask for the
+    entries added since an earlier point even after old ones were dropped.
+    """
+
+    __slots__ = ("total",)
+
+    def __init__(self, max_entries: int | None = None):
+        super().__init__(maxlen=max_entries)
+        self.total = 0
+
+    def append(self, entry: str) -> None:
+        super().append(entry)
+        self.total += 1
+
+    def since(self, offset: int) -> list[str]:
+        """Return the retained entries appended after the first `offset`."""
+
+        new_entries = self.total - offset
+        if new_entries <= 0:
+            return []
+        return list(self)[-new_entries:]
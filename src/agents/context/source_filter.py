@@ -3,9 +3,10 @@ Source filtering data structures.
 """
 
 from dataclasses import dataclass, field
+from urllib.parse import urlsplit
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceFilterData:
     """Container for flagged sources."""
 
@@ -19,6 +20,15 @@ class SourceFilterData:
         for domain in domains:
             self.add_flagged_source(domain)
 
+    def is_flagged(self, url: str) -> bool:
+        """Whether the URL belongs to a flagged domain or one of its subdomains."""
+
+        host = (urlsplit(url).hostname or "").removeprefix("www.")
+        return any(
+            host == domain or host.endswith(f".{domain}")
+            for domain in self.flagged_sources
+        )
+
     @property
     def search_filter(self) -> str:
         """Get DuckDuckGo filter string."""
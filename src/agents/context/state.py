@@ -2,6 +2,7 @@
 Context management for search workflows.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TypedDict
@@ -17,10 +18,16 @@ class SearchMetadata(TypedDict):
     session_id: float
 
 
-@dataclass
+# Messages kept per run; older plan/summary copies are dropped first
+DEFAULT_MAX_MESSAGES = 20
+
+
+@dataclass(slots=True)
 class SearchContext:
     # Core data containers
-    messages: list[BaseMessage] = field(default_factory=list)
+    messages: deque[BaseMessage] = field(
+        default_factory=lambda: deque(maxlen=DEFAULT_MAX_MESSAGES)
+    )
     filters: SourceFilterData = field(default_factory=SourceFilterData)
 
     # Metadata
@@ -30,3 +37,9 @@ class SearchContext:
             "session_id": datetime.now().timestamp(),
         }
     )
+
+    @classmethod
+    def with_history_limit(cls, max_messages: int | None) -> "SearchContext":
+        """Create a context keeping at most `max_messages` (None: unbounded)."""
+
+        return cls(messages=deque(maxlen=max_messages))
@@ -1,14 +1,15 @@
-"""
-Workflow package for search agent.
-"""
+"""Workflow package for search agent."""
 
-from .graph import create_search_agent_graph
-from .state import AgentState, create_initial_state
-from .runner import run_search_agent_stream
+from src.utils.lazy_exports import lazy_exports
 
-__all__ = [
-    "AgentState",
-    "create_initial_state",
-    "create_search_agent_graph",
-    "run_search_agent_stream",
-]
+__getattr__, __all__ = lazy_exports(
+    __name__,
+    {
+        "AgentState": ".state",
+        "create_initial_state": ".state",
+        "remaining_time": ".state",
+        "create_search_agent_graph": ".graph",
+        "run_search_agent_stream": ".runner",
+        "warm_up": ".runner",
+    },
+)
@@ -2,28 +2,199 @@
 Graph construction and workflow components for search agent.
 """
 
+import asyncio
 import logging
-from typing import Literal
+import time
+from typing import Awaitable, Callable, Literal
 from langgraph.graph import StateGraph, START, END
 from langchain_core.messages import AIMessage, HumanMessage
 
-from src.agents.components import PlanGenerator, ActionExecutor, Summarizer
-from src.utils import ValidationStatus
-from src.agents.workflow.state import AgentState
+from src.agents.components import (
+    PlanGenerator,
+    ActionExecutor,
+    Summarizer,
+    PageFetcher,
+    PassageIndex,
+)
+from src.agents.components.action import SearchResult, merge_results
+from src.agents.components.evidence import SearchEvidence
+from src.utils import ValidationStatus, metrics
+from src.agents.workflow.state import AgentState, remaining_time
 
 logger = logging.getLogger(__name__)
 
+# Seconds kept free for summarization when earlier stages run under a deadline
+SUMMARY_RESERVE_SECONDS = 6.0
+# Remaining budget below which a run trims its plan and summarization context
+LOW_BUDGET_SECONDS = 15.0
+LOW_BUDGET_PLAN_STEPS = 2
+LOW_BUDGET_CONTEXT_CHARS = 6_000
+
+# Nodes that run again on every retry
+RETRY_NODES = ("prepare_retry", "execute_search", "fetch_pages", "summarize")
+
+
+def timed(
+    name: str, node: Callable[[AgentState], Awaitable[AgentState]]
+) -> Callable[[AgentState], Awaitable[AgentState]]:
+    """Record how long a node takes, to estimate what fits in the deadline."""
+
+    async def run(state: AgentState) -> AgentState:
+        start = time.monotonic()
+        try:
+            return await node(state)
+        finally:
+            state["node_timings"][name] = time.monotonic() - start
+
+    return run
+
+
+def log_degradation(state: AgentState, reason: str) -> None:
+    logger.warning(f"Degraded run: {reason}")
+    state["execution_log"].append(f"⏱️ {reason}")
+
+
+def search_timeout(state: AgentState) -> float | None:
+    """Time a search may take, leaving the summary its reserve when possible."""
+
+    remaining = remaining_time(state)
+    if remaining is None:
+        return None
+    # Always allow a short search as long as it can end by the deadline
+    return max(remaining - SUMMARY_RESERVE_SECONDS, min(1.0, max(remaining, 0.0)))
+
+
+def trim_sections(sections: list[str], max_chars: int) -> list[str]:
+    """Shorten every section evenly so each plan step keeps its best evidence."""
+
+    if not sections:
+        return sections
+    share = max_chars // len(sections)
+    return [section[:share] for section in sections]
+
+
+def create_search_agent_graph(
+    max_results: int = 4,
+    fetch_pages: bool = False,
+    max_passages: int | None = 20,
+    map_reduce_threshold: int = 12_000,
+    speculative: bool = False,
+    skip_clear_validation: bool = False,
+):
+    """
+    Build the search agent graph.
+
+    Args:
+        max_results: Number of search results per query (default: 4)
+        fetch_pages: Fetch the top result pages after searching (default: False)
+        max_passages: Number of top-ranked passages passed to the Summarizer,
+            or None to pass every result in plan order (default: 20)
+        map_reduce_threshold: Evidence size in characters above which the
+            Summarizer switches to map-reduce; the default passage budget
+            stays under it, so it applies to unranked or larger evidence
+            (default: 12000)
+        speculative: Prefetch the next result page while summarizing so a
+            retry can be served without a new search (default: False)
+        skip_clear_validation: Skip the model's validation on the first attempt
+            when a local check finds the full evidence sent clearly
+            sufficient (default: False)
+    """
 
-def create_search_agent_graph(max_results: int = 4):
     plan_generator = PlanGenerator()
     action_executor = ActionExecutor(max_results)
-    summarizer = Summarizer()
+    summarizer = Summarizer(map_reduce_threshold)
+    page_fetcher = PageFetcher() if fetch_pages else None
 
     workflow = StateGraph(AgentState)
 
+    def select_evidence(state: AgentState) -> SearchEvidence:
+        """Select the evidence for the Summarizer from the raw results."""
+
+        results = state["raw_results"]
+        if max_passages is None:
+            return SearchEvidence(results=results)
+
+        index = PassageIndex.from_results(results)
+        query = " ".join([state["user_query"], *state["plan"]])
+        passages = index.top(query, max_passages)
+        logger.debug(f"Selected {len(passages)}/{len(index)} passages")
+        return SearchEvidence(passages=passages)
+
+    def start_prefetch(state: AgentState) -> asyncio.Task | None:
+        """Search the next result page in the background for a possible retry."""
+
+        if not speculative or not state["raw_results"]:
+            return None
+        if state["attempt"] >= state["max_attempts"]:
+            return None
+
+        steps = max(result.task_number for result in state["raw_results"])
+        search_filter = state["context"].filters.search_filter
+        page = state["attempt"] + 1
+        metrics.increment("speculation_started")
+
+        async def prefetch() -> list[SearchResult]:
+            start = time.monotonic()
+            try:
+                return await action_executor.execute_plan(
+                    state["plan"], search_filter, max_steps=steps, page=page
+                )
+            except Exception as e:
+                logger.debug(f"Speculative prefetch failed: {e}")
+                return []
+            finally:
+                metrics.increment("speculation_queries", steps)
+                metrics.observe("speculation_prefetch", time.monotonic() - start)
+
+        return asyncio.create_task(prefetch())
+
+    async def serve_from_prefetch(
+        state: AgentState, max_steps: int | None
+    ) -> list[SearchResult] | None:
+        """Serve a retry from the prefetched pool, minus flagged sources."""
+
+        prefetch = state["prefetch"]
+        if prefetch is None:
+            return None
+        state["prefetch"] = None
+
+        # The prefetch is the search a retry would run anyway, so it gets the
+        # same time a new search would
+        try:
+            pool = await asyncio.wait_for(prefetch, search_timeout(state))
+        except Exception as e:
+            logger.debug(f"Speculative prefetch failed: {e}")
+            pool = []
+        if not pool:
+            metrics.increment("speculation_misses")
+            return None
+
+        previous = state["raw_results"]
+        results = merge_results(
+            previous,
+            pool,
+            state["context"].filters.is_flagged,
+            action_executor.max_results * state["attempt"],
+        )
+        if max_steps is not None:
+            results = [r for r in results if r.task_number <= max_steps]
+        seen = {info.url for result in previous for info in result.results}
+        added = sum(
+            info.url not in seen for result in results for info in result.results
+        )
+        if not added:
+            metrics.increment("speculation_misses")
+            return None
+
+        metrics.increment("speculation_hits")
+        state["execution_log"].append(
+            f"   ⚡ Served from prefetched results ({added} new, no new search)"
+        )
+        return results
+
     # Node Functions
 
-    def node_generate_plan(state: AgentState) -> AgentState:
+    async def node_generate_plan(state: AgentState) -> AgentState:
         """Generate search plan from user query."""
 
         try:
@@ -33,7 +204,21 @@ def create_search_agent_graph(max_results: int = 4):
 
             context.messages.append(HumanMessage(user_query))
 
-            plan = plan_generator.generate_plan(user_query)
+            remaining = remaining_time(state)
+            timeout = None if remaining is None else remaining - SUMMARY_RESERVE_SECONDS
+            try:
+                # Async call, so a timeout also stops the model request
+                plan = await asyncio.wait_for(
+                    plan_generator.agenerate_plan(user_query), timeout
+                )
+            except TimeoutError:
+                log_degradation(
+                    state,
+                    "Plan generation ran out of time, searching the query directly",
+                )
+                state["plan"] = [user_query]
+                return state
+
             state["plan"] = plan.steps
 
             context.messages.append(AIMessage(f"Generated search plan:\n{plan}"))
@@ -68,11 +253,32 @@ def create_search_agent_graph(max_results: int = 4):
                     f"   🚫 Using search filter: {search_filter}"
                 )
 
-            # Execute search
-            results = await action_executor.execute_plan(state["plan"], search_filter)
+            # Fit the search into the remaining time budget
+            max_steps = None
+            remaining = remaining_time(state)
+            if remaining is not None:
+                plan_steps = len(state["plan"])
+                if (
+                    remaining < LOW_BUDGET_SECONDS
+                    and plan_steps > LOW_BUDGET_PLAN_STEPS
+                ):
+                    max_steps = LOW_BUDGET_PLAN_STEPS
+                    log_degradation(
+                        state,
+                        f"Low time budget, searching {max_steps}/{plan_steps} plan steps",
+                    )
+
+            # Execute search, unless a speculative prefetch already covers it
+            results = await serve_from_prefetch(state, max_steps)
+            if results is None:
+                results = await action_executor.execute_plan(
+                    state["plan"],
+                    search_filter,
+                    max_steps=max_steps,
+                    timeout=search_timeout(state),
+                )
 
             # Aggregate results
-            search_results = ""
             search_summary: list[str] = []
             successful_searches = 0
 
@@ -81,7 +287,6 @@ def create_search_agent_graph(max_results: int = 4):
                 task_number = search_result.task_number
 
                 if search_content:
-                    search_results += search_content + "\n"
                     successful_searches += 1
                     search_summary.append(f"• Task {task_number}: ✅")
                 elif search_content is None:
@@ -89,6 +294,8 @@ def create_search_agent_graph(max_results: int = 4):
                 else:
                     search_summary.append(f"• Task {task_number}: ⚠️ No results")
 
+            state["raw_results"] = results
+            search_results = select_evidence(state)
             state["search_results"] = search_results
 
             # Add detailed execution log
@@ -117,10 +324,66 @@ def create_search_agent_graph(max_results: int = 4):
         except Exception as e:
             logger.error(f"Error executing search: {e}")
             state["execution_log"].append(f"❌ Error executing search: {str(e)}")
-            state["search_results"] = f"Error occurred during search: {str(e)}"
+            state["raw_results"] = []
+            state["search_results"] = SearchEvidence(
+                error=f"Error occurred during search: {str(e)}"
+            )
+            return state
+
+    async def node_fetch_pages(state: AgentState) -> AgentState:
+        """Fetch the top result pages to replace snippets with page text."""
+
+        if page_fetcher is None or not state["raw_results"]:
+            return state
+
+        try:
+            deadline = None
+            remaining = remaining_time(state)
+            if remaining is not None:
+                deadline = remaining - SUMMARY_RESERVE_SECONDS
+                if deadline < 1.0:
+                    log_degradation(state, "Skipping page fetch, not enough time left")
+                    return state
+
+            state["execution_log"].append("🌐 Fetching result pages...")
+
+            fetched = await page_fetcher.enrich(state["raw_results"], deadline)
+            if fetched:
+                state["search_results"] = select_evidence(state)
+
+            state["execution_log"].append(
+                f"✅ Fetched {fetched}/{page_fetcher.max_pages} pages"
+            )
+            state["execution_log"].append(
+                f"   📄 Total content: {len(state['search_results'])} characters"
+            )
+
+            logger.debug(f"Pages fetched: {fetched}")
             return state
 
-    def node_summarize(state: AgentState) -> AgentState:
+        except Exception as e:
+            logger.error(f"Error fetching pages: {e}")
+            state["execution_log"].append(f"❌ Error fetching pages: {str(e)}")
+            return state
+
+    async def node_summarize(state: AgentState) -> AgentState:
+        """Synthesize search results, prefetching the next attempt meanwhile.
+
+        The prefetch keeps running after this node; a retry awaits it in
+        execute_search and finalize cancels it when no retry follows.
+        """
+
+        prefetch = start_prefetch(state)
+        try:
+            state = await summarize_results(state)
+        except BaseException:
+            if prefetch is not None:
+                prefetch.cancel()
+            raise
+        state["prefetch"] = prefetch
+        return state
+
+    async def summarize_results(state: AgentState) -> AgentState:
         """Synthesize search results and validate the response."""
 
         try:
@@ -132,16 +395,82 @@ def create_search_agent_graph(max_results: int = 4):
             state["execution_log"].append(
                 f"   📊 Processing {input_length} characters of search data"
             )
+            # Render the evidence only for the duration of this call
+            sections = state["search_results"].sections()
+            search_results = "".join(sections)
+            map_reduce = None
+            trimmed = False
+
+            # Shrink the context when the deadline is close
+            remaining = remaining_time(state)
+            if remaining is not None:
+                if remaining <= 0:
+                    log_degradation(state, "Deadline reached before summarizing")
+                    state["summary_valid"] = ValidationStatus.INVALID
+                    return state
+                if remaining < LOW_BUDGET_SECONDS:
+                    map_reduce = False
+                    if input_length > LOW_BUDGET_CONTEXT_CHARS:
+                        sections = trim_sections(sections, LOW_BUDGET_CONTEXT_CHARS)
+                        search_results = "".join(sections)
+                        trimmed = True
+                        log_degradation(
+                            state,
+                            f"Low time budget, summarizing {len(search_results)}"
+                            f"/{input_length} characters",
+                        )
+
+            splits = map_reduce is None and summarizer.uses_map_reduce(
+                search_results, sections
+            )
+            if splits:
+                state["execution_log"].append(
+                    f"   🧩 Summarizing {len(sections)} parts before combining"
+                )
 
-            summarized_result = summarizer.summarize(
-                state["user_query"], state["search_results"]
+            # Validation is only skipped on the first attempt, and only when
+            # the evidence checked is what the model sees: neither trimmed nor
+            # replaced by map-reduce notes. Retries follow a failed validation
+            # and are always checked
+            validate = not (
+                skip_clear_validation
+                and state["attempt"] == 1
+                and not trimmed
+                and not splits
+                and state["search_results"].is_sufficient(state["user_query"])
             )
+            state["validation_skipped"] = not validate
+            if not validate:
+                metrics.increment("summarize.validation_skipped")
+                state["execution_log"].append(
+                    "   ⚡ Evidence clearly sufficient, skipping validation"
+                )
+
+            try:
+                summarized_result = await asyncio.wait_for(
+                    summarizer.asummarize(
+                        state["user_query"],
+                        search_results,
+                        sections,
+                        map_reduce,
+                        attempt=state["attempt"],
+                        validate=validate,
+                    ),
+                    remaining,
+                )
+            except TimeoutError:
+                log_degradation(
+                    state, "Summarization did not finish before the deadline"
+                )
+                state["summary_valid"] = ValidationStatus.INVALID
+                return state
 
             is_valid = summarized_result.status == ValidationStatus.VALID
             summary = summarized_result.summary
             flagged = summarized_result.flagged_sources
             state["summary_valid"] = summarized_result.status
             state["summary"] = summary
+            state["draft_answer"] = summary
 
             # Add summary to message history
             summary_preview = summary[:150] + "..." if len(summary) > 150 else summary
@@ -150,7 +479,11 @@ def create_search_agent_graph(max_results: int = 4):
             # Update validation status with detailed logging
             if is_valid:
                 state["final_answer"] = summary
-                state["execution_log"].append("✅ Summary validated successfully")
+                state["execution_log"].append(
+                    "✅ Answer written without validation"
+                    if state["validation_skipped"]
+                    else "✅ Summary validated successfully"
+                )
                 state["execution_log"].append(
                     f"   📝 Final answer: {len(summary)} characters"
                 )
@@ -179,49 +512,100 @@ def create_search_agent_graph(max_results: int = 4):
             state["summary"] = f"Error occurred during summarization: {str(e)}"
             return state
 
-    # Conditional Logic
-    def should_retry_summary(state: AgentState) -> Literal["execute_search", "end"]:
-        """Decide whether to retry search or end with current best answer."""
+    async def node_prepare_retry(state: AgentState) -> AgentState:
+        """Move on to the next search attempt."""
+
+        state["attempt"] += 1
+        state["execution_log"].append(
+            f"🔄 Retrying search (Attempt {state['attempt']}/{state['max_attempts']})"
+        )
+        return state
+
+    async def node_finalize(state: AgentState) -> AgentState:
+        """Settle the final answer when the run ends without a valid summary."""
 
         user_query = state["user_query"]
-        if state["summary_valid"]:
-            return "end"
-        elif state["attempt"] < state["max_attempts"]:
-            # Check if we have meaningful search results to retry with
-            if not state["search_results"].strip():
-                logger.warning(
-                    f"No search results available on attempt {state['attempt']}, ending workflow"
-                )
-                state["final_answer"] = (
-                    f"Unable to find sufficient information about: {user_query}"
+        if state["prefetch"] is not None:
+            state["prefetch"].cancel()
+            state["prefetch"] = None
+            metrics.increment("speculation_wasted")
+        if state["summary_valid"] == ValidationStatus.VALID:
+            return state
+
+        out_of_time = state["deadline"] is not None and not has_time_for_retry(state)
+        if state["attempt"] < state["max_attempts"] and not out_of_time:
+            logger.warning(
+                f"No search results available on attempt {state['attempt']}, ending workflow"
+            )
+            state["final_answer"] = (
+                f"Unable to find sufficient information about: {user_query}"
+            )
+        elif out_of_time and state["draft_answer"].strip():
+            # Return the best unvalidated answer rather than nothing
+            if state["attempt"] < state["max_attempts"]:
+                log_degradation(
+                    state, "Skipping retry, not enough time left for another attempt"
                 )
-                return "end"
-            state["attempt"] += 1
-            return "execute_search"
-        else:
+            log_degradation(state, "Returning the best available unvalidated answer")
+            state["final_answer"] = state["draft_answer"]
+        elif not state["final_answer"].strip():
             # Provide fallback answer if we've exhausted attempts
-            if not state["final_answer"].strip():
-                state["final_answer"] = (
-                    f"Search completed but unable to provide definitive answer for: {user_query}"
-                )
-            return "end"
+            state["final_answer"] = (
+                f"Search completed but unable to provide definitive answer for: {user_query}"
+            )
+        return state
+
+    # Conditional Logic
+    def has_time_for_retry(state: AgentState) -> bool:
+        """Whether another attempt, timed like the last one, fits the deadline."""
+
+        remaining = remaining_time(state)
+        if remaining is None:
+            return True
+        timings = state["node_timings"]
+        return remaining > sum(timings.get(name, 0.0) for name in RETRY_NODES)
+
+    def should_retry_summary(
+        state: AgentState,
+    ) -> Literal["prepare_retry", "finalize"]:
+        """Decide whether to retry search or end with current best answer."""
 
-    workflow.add_node("generate_plan", node_generate_plan)
-    workflow.add_node("execute_search", node_execute_search)
-    workflow.add_node("summarize", node_summarize)
+        if state["summary_valid"] == ValidationStatus.VALID:
+            return "finalize"
+        if state["attempt"] >= state["max_attempts"]:
+            return "finalize"
+        # Check if we have meaningful search results to retry with
+        if not state["search_results"]:
+            return "finalize"
+        if not has_time_for_retry(state):
+            return "finalize"
+        return "prepare_retry"
+
+    workflow.add_node("generate_plan", timed("generate_plan", node_generate_plan))
+    workflow.add_node("execute_search", timed("execute_search", node_execute_search))
+    workflow.add_node("summarize", timed("summarize", node_summarize))
+    workflow.add_node("prepare_retry", timed("prepare_retry", node_prepare_retry))
+    workflow.add_node("finalize", node_finalize)
 
     workflow.add_edge(START, "generate_plan")
     workflow.add_edge("generate_plan", "execute_search")
-    workflow.add_edge("execute_search", "summarize")
+    if page_fetcher is not None:
+        workflow.add_node("fetch_pages", timed("fetch_pages", node_fetch_pages))
+        workflow.add_edge("execute_search", "fetch_pages")
+        workflow.add_edge("fetch_pages", "summarize")
+    else:
+        workflow.add_edge("execute_search", "summarize")
 
     workflow.add_conditional_edges(
         "summarize",
         should_retry_summary,
         {
-            "execute_search": "execute_search",
-            "end": END,
+            "prepare_retry": "prepare_retry",
+            "finalize": "finalize",
         },
     )
+    workflow.add_edge("prepare_retry", "execute_search")
+    workflow.add_edge("finalize", END)
 
     return workflow.compile()
 
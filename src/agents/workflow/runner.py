@@ -1,23 +1,109 @@
 """
 the main entry points for running search agent workflows
+
+LangChain, LangGraph, Langfuse and DDGS are imported on first use (or by
+`warm_up`) so that importing this module stays cheap.
 """
 
+import asyncio
+import functools
 import logging
-from langfuse.langchain import CallbackHandler
-
-from src.agents.workflow.state import create_initial_state
-from src.agents.workflow.graph import create_search_agent_graph
+import threading
+import time
+from typing import Callable
 
 logger = logging.getLogger(__name__)
 
+_graph_lock = threading.Lock()
+
+# Evidence size in characters above which summaries use map-reduce
+MAP_REDUCE_THRESHOLD = 12_000
+
+# Messages and execution log entries kept per run
+MAX_MESSAGES = 20
+MAX_LOG_ENTRIES = 200
+
+
+@functools.cache
+def _build_graph(
+    fetch_pages: bool,
+    speculative: bool,
+    map_reduce_threshold: int,
+    skip_clear_validation: bool,
+):
+    from src.agents.workflow.graph import create_search_agent_graph
+
+    return create_search_agent_graph(
+        fetch_pages=fetch_pages,
+        speculative=speculative,
+        map_reduce_threshold=map_reduce_threshold,
+        skip_clear_validation=skip_clear_validation,
+    )
+
+
+def get_search_agent_graph(
+    fetch_pages: bool = False,
+    speculative: bool = False,
+    map_reduce_threshold: int = MAP_REDUCE_THRESHOLD,
+    skip_clear_validation: bool = False,
+):
+    """Return the compiled graph for these options, building it only once."""
+
+    with _graph_lock:
+        return _build_graph(
+            fetch_pages, speculative, map_reduce_threshold, skip_clear_validation
+        )
 
-async def run_search_agent_stream(user_query: str, max_attempts: int = 3):
+
+def warm_up() -> float:
+    """
+    Import the heavy dependencies and build the default graph.
+
+    Returns:
+        Seconds spent warming up
+    """
+    start = time.perf_counter()
+    get_search_agent_graph()
+    from langfuse.langchain import CallbackHandler  # noqa: F401
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Search agent warmed up in {elapsed:.2f}s")
+    return elapsed
+
+
+async def run_search_agent_stream(
+    user_query: str,
+    max_attempts: int = 3,
+    fetch_pages: bool = False,
+    time_budget: float | None = None,
+    speculative: bool = False,
+    map_reduce_threshold: int = MAP_REDUCE_THRESHOLD,
+    memory_hook: Callable[[int], None] | None = None,
+    started_at: float | None = None,
+    skip_clear_validation: bool = False,
+    max_messages: int | None = MAX_MESSAGES,
+    max_log_entries: int | None = MAX_LOG_ENTRIES,
+):
     """
     Run the search agent with streaming execution events.
 
     Args:
         user_query: The user's information request
         max_attempts: Maximum number of retry attempts
+        fetch_pages: Fetch result pages instead of relying on snippets only
+        time_budget: Seconds the run may take before returning its best answer
+        speculative: Prefetch the next attempt's results while summarizing
+        map_reduce_threshold: Evidence size in characters above which the
+            summary is built per plan step first
+        memory_hook: Called with the peak state size in bytes once the run ends
+            (default: log it and record it in the metrics)
+        started_at: time.monotonic() the time budget runs from
+            (default: now)
+        skip_clear_validation: Skip the model's validation on the first
+            attempt when the evidence clearly covers the query
+        max_messages: Messages kept in the run's history, or None for all
+        max_log_entries: Execution log entries kept for the run, or None
+            for all
 
     Yields:
         Execution events with updated state
@@ -27,20 +113,42 @@ async def run_search_agent_stream(user_query: str, max_attempts: int = 3):
             f"Starting streaming search agent for query: {user_query[:100]}..."
         )
 
-        # Create the graph
-        graph = create_search_agent_graph()
+        # Get the graph, building it off the event loop if not warmed up yet
+        graph = await asyncio.to_thread(
+            get_search_agent_graph,
+            fetch_pages,
+            speculative,
+            map_reduce_threshold,
+            skip_clear_validation,
+        )
+
+        from langfuse.langchain import CallbackHandler
+        from src.agents.workflow.state import create_initial_state
+        from src.utils.memory import MemoryTracker
 
         # Initialize state
-        initial_state = create_initial_state(user_query, max_attempts)
+        initial_state = create_initial_state(
+            user_query,
+            max_attempts,
+            time_budget,
+            max_messages=max_messages,
+            max_log_entries=max_log_entries,
+            started_at=started_at,
+        )
+        memory = MemoryTracker(memory_hook) if memory_hook else MemoryTracker()
 
         # Initialize Langfuse callback handler
         langfuse_handler = CallbackHandler()
 
-        # Run the graph with streaming
-        async for event in graph.astream(
-            initial_state, config={"callbacks": [langfuse_handler]}
-        ):
-            yield event
+        # Run the graph with streaming, reporting the peak even if aborted
+        try:
+            async for event in graph.astream(
+                initial_state, config={"callbacks": [langfuse_handler]}
+            ):
+                memory.observe(event)
+                yield event
+        finally:
+            memory.report()
 
     except Exception as e:
         logger.error(f"Error in streaming search agent: {e}")
@@ -48,5 +156,7 @@ async def run_search_agent_stream(user_query: str, max_attempts: int = 3):
 
 
 __all__ = [
+    "get_search_agent_graph",
     "run_search_agent_stream",
+    "warm_up",
 ]
@@ -4,8 +4,13 @@ State definitions for search agent workflow.
 Defines the core state structure and initialization logic for LangGraph workflows.
 """
 
+import asyncio
+import time
 from typing import TypedDict
-from src.agents.context import SearchContext
+from src.agents.context import ExecutionLog, SearchContext
+from src.agents.context.state import DEFAULT_MAX_MESSAGES
+from src.agents.components.action import SearchResult
+from src.agents.components.evidence import SearchEvidence
 
 from src.utils.validation_status import ValidationStatus
 
@@ -16,34 +21,71 @@ class AgentState(TypedDict):
     # Core workflow data
     user_query: str
     plan: list[str]
-    search_results: str
+    raw_results: list[SearchResult]
+    prefetch: asyncio.Task[list[SearchResult]] | None
+    search_results: SearchEvidence
     summary: str
     summary_valid: ValidationStatus
+    # The summary was accepted without the model's validation step
+    validation_skipped: bool
+    draft_answer: str
 
     # Control flow
     attempt: int
     max_attempts: int
+    deadline: float | None
+    node_timings: dict[str, float]
 
     # Results
     final_answer: str
-    execution_log: list[str]
+    execution_log: ExecutionLog
 
     # Context reference
     context: SearchContext
 
 
-def create_initial_state(user_query: str, max_attempts: int = 3) -> AgentState:
-    context = SearchContext()
+# Log entries kept per run; clients receive each entry as it is appended
+DEFAULT_MAX_LOG_ENTRIES = 200
+
+
+def create_initial_state(
+    user_query: str,
+    max_attempts: int = 3,
+    time_budget: float | None = None,
+    max_messages: int | None = DEFAULT_MAX_MESSAGES,
+    max_log_entries: int | None = DEFAULT_MAX_LOG_ENTRIES,
+    started_at: float | None = None,
+) -> AgentState:
+    context = SearchContext.with_history_limit(max_messages)
+    # The budget runs from `started_at` (time.monotonic()), e.g. when the
+    # request arrived, so time spent queued counts against it
+    if started_at is None:
+        started_at = time.monotonic()
+    deadline = started_at + time_budget if time_budget is not None else None
 
     return {
         "user_query": user_query,
         "plan": [],
-        "search_results": "",
+        "raw_results": [],
+        "prefetch": None,
+        "search_results": SearchEvidence(),
         "summary": "",
         "summary_valid": ValidationStatus.INVALID,
+        "validation_skipped": False,
+        "draft_answer": "",
         "attempt": 1,
         "max_attempts": max_attempts,
+        "deadline": deadline,
+        "node_timings": {},
         "final_answer": "",
-        "execution_log": [],
+        "execution_log": ExecutionLog(max_log_entries),
         "context": context,
     }
+
+
+def remaining_time(state: AgentState) -> float | None:
+    """Seconds left until the request deadline, or None without a deadline."""
+
+    if state["deadline"] is None:
+        return None
+    return state["deadline"] - time.monotonic()
@@ -0,0 +1,18 @@
+from typing import Any
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from src.utils.metrics import metrics
+
+router = APIRouter()
+
+
+class MetricsResponse(BaseModel):
+    counters: dict[str, int] = Field(description="Event counters")
+    timings: dict[str, dict[str, Any]] = Field(description="Timing statistics")
+    sizes: dict[str, dict[str, Any]] = Field(description="Size statistics in bytes")
+
+
+@router.get("/metrics", tags=["Health"], response_model=MetricsResponse)
+def get_metrics():
+    return MetricsResponse(**metrics.snapshot())
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Response, status
+from pydantic import BaseModel, Field
+
+from src.utils.readiness import readiness
+
+router = APIRouter()
+
+
+class ReadyResponse(BaseModel):
+    status: str = Field(description="Readiness status")
+    warmup_seconds: float | None = Field(
+        default=None, description="Time taken to warm up the search agent"
+    )
+    error: str | None = Field(default=None, description="Warm-up failure, if any")
+
+
+@router.get("/ready", tags=["Health"], response_model=ReadyResponse)
+def ready_check(response: Response):
+    if readiness.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadyResponse(
+        status=readiness.status,
+        warmup_seconds=readiness.warmup_seconds,
+        error=readiness.error,
+    )
@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Annotated, AsyncGenerator, Literal, Any
 from src.agents.workflow.runner import run_search_agent_stream
+from src.server.scheduler import QueueFullError, QueueTimeoutError, get_scheduler
+from src.utils.validation_status import ValidationStatus
+from contextlib import aclosing
+import asyncio
 import logging
 import json
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +18,9 @@ router = APIRouter()
 
 class StreamEventData(BaseModel):
     attempt: int
+    # Only the log entries appended since the previous event
     execution_log: list[str]
+    log_offset: int = 0
     plan: list[str] = Field(default_factory=list)
     search_results_length: int = 0
     summary_status: str = ""
@@ -34,58 +41,125 @@ class SearchResult(BaseModel):
     execution_log: list[str]
     attempts: int
     flagged_sources: list[str] = Field(default_factory=list)
+    # False when the answer was not checked by the model's validation step
+    validated: bool = False
+
+
+def summary_status(node_output: dict[str, Any]) -> str:
+    """The summary status, telling answers accepted without validation apart."""
+
+    status = node_output.get("summary_valid", "")
+    if status == ValidationStatus.VALID and node_output.get("validation_skipped"):
+        return "UNVALIDATED"
+    return str(status)
+
+
+def format_node_event(
+    node_name: str, node_output: dict[str, Any], log_offset: int = 0
+) -> str:
+    """Format a completed graph node as an SSE message.
+
+    Only the execution log entries after `log_offset` are included.
+    """
+
+    execution_log = node_output.get("execution_log")
+    event_data = StreamEventData(
+        attempt=node_output.get("attempt", 1),
+        execution_log=execution_log.since(log_offset) if execution_log else [],
+        log_offset=log_offset,
+        plan=node_output.get("plan", []),
+        search_results_length=len(node_output.get("search_results") or ""),
+        summary_status=summary_status(node_output),
+        final_answer=node_output.get("final_answer", ""),
+    )
+
+    stream_event = StreamEvent(
+        event_type="node_completed",
+        node_name=node_name,
+        data=event_data.model_dump(),
+    )
+
+    return f"data: {json.dumps(stream_event.model_dump())}\n\n"
 
 
 @router.get("/search", tags=["Search"])
 async def search_stream(
+    request: Request,
     query: Annotated[str, Query(min_length=1, max_length=500)],
     max_attempts: Annotated[int, Query(ge=1, le=5)] = 3,
+    fetch_pages: bool = False,
+    time_budget: Annotated[float | None, Query(gt=0, le=300)] = None,
+    speculative: bool = False,
+    skip_clear_validation: bool = False,
+    priority: Literal["interactive", "batch"] = "interactive",
 ):
     """
     Perform a search query with SSE streaming updates.
+
+    `time_budget` (seconds) bounds the run; when it runs short the search is
+    degraded and the best available answer is returned. With
+    `skip_clear_validation`, the first answer is not validated by the model when
+    the evidence clearly covers the query. Runs are queued fairly
+    per client (API key or IP); `priority=batch` yields to interactive runs.
     """
 
+    # The time budget runs from arrival, so time spent queued counts against it
+    started_at = time.monotonic()
+    scheduler = get_scheduler()
+    client = scheduler.identify(
+        request.headers, request.client.host if request.client else None
+    )
+
     async def generate_stream() -> AsyncGenerator[str, None]:
         # Send initial event
         start_event = StreamEvent(event_type="started", data={"query": query})
         yield f"data: {json.dumps(start_event.model_dump())}\n\n"
 
         final_state = None
-
-        async for event in run_search_agent_stream(
-            user_query=query, max_attempts=max_attempts
-        ):
-            for node_name, node_output in event.items():
-                if node_name != "__end__":
-                    event_data = StreamEventData(
-                        attempt=node_output.get("attempt", 1),
-                        execution_log=node_output.get("execution_log", []),
-                        plan=node_output.get("plan", []),
-                        search_results_length=len(
-                            node_output.get("search_results", "")
-                        ),
-                        summary_status=str(node_output.get("summary_valid", "")),
-                        final_answer=node_output.get("final_answer", ""),
-                    )
-
-                    stream_event = StreamEvent(
-                        event_type="node_completed",
-                        node_name=node_name,
-                        data=event_data.model_dump(),
-                    )
-
-                    yield f"data: {json.dumps(stream_event.model_dump())}\n\n"
-
-                final_state = node_output
+        log_offset = 0
+
+        try:
+            # Wait for a run slot inside the stream, so a client that leaves
+            # while queued gives up its place, and no longer than the budget
+            async with scheduler.slot(client, priority, timeout=time_budget):
+                stream = run_search_agent_stream(
+                    user_query=query,
+                    max_attempts=max_attempts,
+                    fetch_pages=fetch_pages,
+                    time_budget=time_budget,
+                    speculative=speculative,
+                    started_at=started_at,
+                    skip_clear_validation=skip_clear_validation,
+                )
+                # Close the graph run with the stream, even when cancelled mid-way
+                async with aclosing(stream):
+                    async for event in stream:
+                        for node_name, node_output in event.items():
+                            if node_name != "__end__":
+                                yield format_node_event(
+                                    node_name, node_output, log_offset
+                                )
+                                log_offset = node_output["execution_log"].total
+                            final_state = node_output
+        except (QueueFullError, QueueTimeoutError) as e:
+            error_event = StreamEvent(event_type="error", data={"error": str(e)})
+            yield f"data: {json.dumps(error_event.model_dump())}\n\n"
+            return
+        except asyncio.CancelledError:
+            # Client disconnected or the server drain deadline was exceeded
+            logger.warning(f"Search stream cancelled: {query[:100]}")
+            raise
 
         # Send search result
         if final_state:
             search_result = SearchResult(
                 query=query,
                 final_answer=final_state.get("final_answer", ""),
-                execution_log=final_state.get("execution_log", []),
+                execution_log=list(final_state.get("execution_log", [])),
                 attempts=final_state.get("attempts", final_state.get("attempt", 1)),
                 flagged_sources=final_state.get("flagged_sources", []),
+                validated=final_state.get("summary_valid") == ValidationStatus.VALID
+                and not final_state.get("validation_skipped", False),
             )
 
             final_event = StreamEvent(
@@ -0,0 +1,6 @@
+"""Production server package for the search agent API."""
+
+from .launcher import LauncherConfig, run_workers
+from .scheduler import FairScheduler, get_scheduler
+
+__all__ = ["LauncherConfig", "run_workers", "FairScheduler", "get_scheduler"]
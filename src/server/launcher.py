@@ -0,0 +1,243 @@
+"""
+Pre-fork multi-worker launcher for production.
+
+The master process loads config, prompts and the heavy libraries once, binds
+the listening socket and forks the workers, so they start warm and share
+those pages copy-on-write. Workers exit after serving a configurable number
+of requests and are replaced. On SIGTERM every worker stops accepting
+connections and in-flight SSE streams get until the graceful timeout to
+finish before they are cancelled.
+
+Usage:
+    python -m src.server.launcher --workers 4 --port 8000
+"""
+
+import argparse
+import logging
+import os
+import random
+import signal
+import socket
+import time
+from dataclasses import dataclass, field
+from importlib import import_module
+
+import uvicorn
+from dotenv import load_dotenv
+
+from src.utils.readiness import readiness
+
+logger = logging.getLogger(__name__)
+
+# Modules imported before forking. LLM clients are not created here because
+# their gRPC channels are not fork-safe; each worker builds its own graph.
+PRELOAD_MODULES = (
+    "src.agents.components.prompt.plan",
+    "src.agents.components.prompt.summarizer",
+    "src.agents.workflow.graph",
+    "langfuse.langchain",
+)
+
+
+@dataclass
+class LauncherConfig:
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    max_requests: int | None = 1000
+    max_requests_jitter: int = 100
+    graceful_timeout: float = 30.0
+    backlog: int = 2048
+    # Proxies trusted to set X-Forwarded-For, so per-client scheduling sees
+    # the real client address (comma-separated IPs or networks, or "*")
+    forwarded_allow_ips: str = "127.0.0.1"
+
+    @classmethod
+    def from_env(cls) -> "LauncherConfig":
+        """Read overrides from SEARCH_AGENT_* environment variables."""
+
+        config = cls()
+        env = os.environ
+        config.host = env.get("SEARCH_AGENT_HOST", config.host)
+        config.port = int(env.get("SEARCH_AGENT_PORT", config.port))
+        config.workers = int(env.get("SEARCH_AGENT_WORKERS", config.workers))
+        if "SEARCH_AGENT_MAX_REQUESTS" in env:
+            config.max_requests = int(env["SEARCH_AGENT_MAX_REQUESTS"]) or None
+        config.graceful_timeout = float(
+            env.get("SEARCH_AGENT_GRACEFUL_TIMEOUT", config.graceful_timeout)
+        )
+        config.forwarded_allow_ips = env.get(
+            "SEARCH_AGENT_FORWARDED_ALLOW_IPS", config.forwarded_allow_ips
+        )
+        return config
+
+
+class DrainingServer(uvicorn.Server):
+    """Uvicorn server that reports draining on /ready as soon as it is told to stop."""
+
+    def handle_exit(self, sig, frame) -> None:
+        readiness.draining = True
+        super().handle_exit(sig, frame)
+
+
+def preload() -> object:
+    """Load config, prompts and heavy libraries once, before forking."""
+
+    load_dotenv()
+    for module in PRELOAD_MODULES:
+        import_module(module)
+    return import_module("app").app
+
+
+def bind_socket(config: LauncherConfig) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((config.host, config.port))
+    sock.listen(config.backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_worker(app: object, sock: socket.socket, config: LauncherConfig) -> None:
+    """Serve requests in a forked worker until recycled or told to stop."""
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(sig, signal.SIG_DFL)
+
+    limit = None
+    if config.max_requests:
+        # Jitter keeps workers from recycling at the same moment
+        limit = config.max_requests + random.randint(0, config.max_requests_jitter)
+
+    server = DrainingServer(
+        uvicorn.Config(
+            app,
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=int(config.graceful_timeout),
+            proxy_headers=True,
+            forwarded_allow_ips=config.forwarded_allow_ips,
+            log_config=None,
+        )
+    )
+    server.run(sockets=[sock])
+
+
+def spawn(app: object, sock: socket.socket, config: LauncherConfig) -> int:
+    pid = os.fork()
+    if pid == 0:
+        exit_code = 0
+        try:
+            run_worker(app, sock, config)
+        except BaseException:
+            logger.exception("Worker crashed")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+    logger.info(f"Started worker {pid}")
+    return pid
+
+
+def run_workers(config: LauncherConfig) -> None:
+    """Run the pre-fork master loop until SIGTERM/SIGINT and all workers exit."""
+
+    app = preload()
+    sock = bind_socket(config)
+    logger.info(
+        f"Listening on {config.host}:{config.port} with {config.workers} workers"
+    )
+
+    workers = {spawn(app, sock, config) for _ in range(config.workers)}
+    stopping = False
+
+    def stop(sig, frame) -> None:
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        logger.info(f"Draining {len(workers)} workers")
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    drain_deadline: float | None = None
+    while workers:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+
+        if pid:
+            workers.discard(pid)
+            if not stopping:
+                # Recycled after max requests, or crashed: keep the pool full
+                logger.info(
+                    f"Worker {pid} exited ({os.waitstatus_to_exitcode(status)}), "
+                    "replacing it"
+                )
+                workers.add(spawn(app, sock, config))
+            continue
+
+        if stopping:
+            if drain_deadline is None:
+                # Workers cancel their own streams at the graceful timeout
+                drain_deadline = time.monotonic() + config.graceful_timeout + 5
+            elif time.monotonic() > drain_deadline:
+                for pid in list(workers):
+                    logger.warning(f"Killing worker {pid} after drain deadline")
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                drain_deadline = float("inf")
+        time.sleep(0.2)
+
+    sock.close()
+    logger.info("All workers stopped")
+
+
+def main() -> None:
+    load_dotenv()
+    defaults = LauncherConfig.from_env()
+
+    parser = argparse.ArgumentParser(description="Run the search agent API")
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=defaults.max_requests or 0,
+        help="Recycle a worker after this many requests (0 disables)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=float,
+        default=defaults.graceful_timeout,
+        help="Seconds in-flight streams get to finish on shutdown",
+    )
+    parser.add_argument(
+        "--forwarded-allow-ips",
+        default=defaults.forwarded_allow_ips,
+        help="Proxy IPs or networks trusted to set X-Forwarded-For",
+    )
+    args = parser.parse_args()
+
+    run_workers(
+        LauncherConfig(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            max_requests=args.max_requests or None,
+            graceful_timeout=args.graceful_timeout,
+            forwarded_allow_ips=args.forwarded_allow_ips,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Per-client fair scheduling of search runs.
+
+Every search run holds one of a fixed number of run slots while it talks to
+the LLM and DDGS. Waiting runs are queued per client and per lane:
+
+- Lanes are served by stride scheduling, so the interactive lane gets most
+  slots while batch work still makes progress.
+- Within a lane, clients are served by start-time fair queuing: each run is
+  tagged with its client's virtual start time, advanced by 1/weight per run,
+  and the lowest tag goes first, so a client that floods the queue only
+  delays itself.
+- A client never holds more than `max_per_client` slots at once.
+
+The scheduler is per process; with the pre-fork launcher each worker
+schedules its own connections.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Collection, Literal, Mapping
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+Lane = Literal["interactive", "batch"]
+
+LANE_WEIGHTS: dict[str, float] = {"interactive": 4.0, "batch": 1.0}
+
+# Start tags kept per lane before those of caught-up clients are pruned
+MAX_TRACKED_CLIENTS = 1024
+
+
+class QueueFullError(Exception):
+    """Raised when a client already has too many runs waiting."""
+
+    def __init__(self, message: str = "Too many queued search requests"):
+        super().__init__(message)
+
+
+class QueueTimeoutError(Exception):
+    """Raised when no run slot is granted within the caller's timeout."""
+
+    def __init__(self, message: str = "Timed out waiting for a search slot"):
+        super().__init__(message)
+
+
+def identify_client(
+    headers: Mapping[str, str], host: str | None, api_keys: Collection[str] = ()
+) -> str:
+    """
+    Identify the caller by API key, falling back to the client IP.
+
+    Only keys in `api_keys` are trusted; any other key could be made up per
+    request to get a fresh fair share, so those callers are identified by IP.
+    """
+
+    api_key = headers.get("x-api-key")
+    if not api_key:
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer":
+            api_key = token.strip()
+    if api_key and api_key in api_keys:
+        return api_key
+    return host or "unknown"
+
+
+def parse_weights(value: str) -> dict[str, float]:
+    """Parse `client=weight,client=weight` into a weight mapping."""
+
+    weights: dict[str, float] = {}
+    for item in value.split(","):
+        client, sep, weight = item.strip().rpartition("=")
+        if sep and client:
+            weights[client] = float(weight)
+    return weights
+
+
+@dataclass(slots=True)
+class _Waiter:
+    client: str
+    lane: str
+    start_tag: float
+    future: asyncio.Future
+
+
+@dataclass(slots=True)
+class _LaneQueue:
+    weight: float
+    pass_value: float = 0.0
+    virtual_time: float = 0.0
+    waiting: dict[str, deque[_Waiter]] = field(default_factory=dict)
+    last_tags: dict[str, float] = field(default_factory=dict)
+
+
+class FairScheduler:
+    """Weighted fair queue with priority lanes in front of search runs."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_per_client: int = 2,
+        max_queued_per_client: int = 16,
+        client_weights: dict[str, float] | None = None,
+        lane_weights: dict[str, float] | None = None,
+        api_keys: Collection[str] = (),
+    ):
+        """
+        Initialize FairScheduler.
+
+        Args:
+            max_concurrency: Search runs allowed at once (default: 8)
+            max_per_client: Search runs one client may hold at once (default: 2)
+            max_queued_per_client: Runs one client may have waiting before
+                new ones are rejected (default: 16)
+            client_weights: Share weight per client id (API key or IP),
+                others weigh 1
+            lane_weights: Share weight per lane (default: interactive 4, batch 1)
+            api_keys: API keys trusted to identify a client; other callers
+                are identified by IP
+        """
+        self.max_concurrency = max_concurrency
+        self.max_per_client = max_per_client
+        self.max_queued_per_client = max_queued_per_client
+        self.client_weights = client_weights or {}
+        self.api_keys = frozenset(api_keys)
+        self.running: dict[str, int] = {}
+        self._lanes = {
+            lane: _LaneQueue(weight)
+            for lane, weight in (lane_weights or LANE_WEIGHTS).items()
+        }
+        self._active = 0
+        self._pass_value = 0.0
+
+    @classmethod
+    def from_env(cls) -> "FairScheduler":
+        """Read overrides from SEARCH_AGENT_* environment variables."""
+
+        env = os.environ
+        return cls(
+            max_concurrency=int(env.get("SEARCH_AGENT_MAX_CONCURRENCY", 8)),
+            max_per_client=int(env.get("SEARCH_AGENT_MAX_PER_CLIENT", 2)),
+            max_queued_per_client=int(env.get("SEARCH_AGENT_MAX_QUEUED", 16)),
+            client_weights=parse_weights(env.get("SEARCH_AGENT_CLIENT_WEIGHTS", "")),
+            api_keys=[
+                key.strip()
+                for key in env.get("SEARCH_AGENT_API_KEYS", "").split(",")
+                if key.strip()
+            ],
+        )
+
+    def identify(self, headers: Mapping[str, str], host: str | None) -> str:
+        """Identify the caller, trusting only this scheduler's API keys."""
+
+        return identify_client(headers, host, self.api_keys)
+
+    @asynccontextmanager
+    async def slot(
+        self, client: str, lane: Lane = "interactive", timeout: float | None = None
+    ) -> AsyncIterator[float]:
+        """
+        Wait for a run slot for `client` in `lane` and hold it for the block.
+
+        Args:
+            client: Client id from `identify`
+            lane: Scheduling lane
+            timeout: Seconds to wait for a slot before giving up (default: none)
+
+        Yields:
+            Seconds spent waiting in the queue
+
+        Raises:
+            QueueFullError: The client already has too many runs waiting
+            QueueTimeoutError: No slot was granted within `timeout`
+        """
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown scheduling lane: {lane}")
+
+        start = time.monotonic()
+        waiter = self._enqueue(client, lane)
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except BaseException as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller went away
+                self._release(client)
+            else:
+                waiter.future.cancel()
+                self._remove(waiter)
+            if isinstance(e, TimeoutError):
+                metrics.increment(f"scheduler.{lane}.timed_out")
+                raise QueueTimeoutError() from e
+            raise
+
+        waited = time.monotonic() - start
+        metrics.observe(f"scheduler.{lane}.queue_seconds", waited)
+        try:
+            yield waited
+        finally:
+            self._release(client)
+
+    def _enqueue(self, client: str, lane: str) -> _Waiter:
+        queue = self._lanes[lane]
+        if len(queue.waiting.get(client, ())) >= self.max_queued_per_client:
+            metrics.increment(f"scheduler.{lane}.rejected")
+            raise QueueFullError()
+
+        if not queue.waiting:
+            # A lane that was idle rejoins at the current pass, not behind it,
+            # and earlier start tags no longer order anything
+            queue.pass_value = max(queue.pass_value, self._pass_value)
+            queue.last_tags.clear()
+        elif len(queue.last_tags) > MAX_TRACKED_CLIENTS:
+            queue.last_tags = {
+                c: tag for c, tag in queue.last_tags.items() if tag > queue.virtual_time
+            }
+
+        # Start-time fair queuing: a new run starts no earlier than the lane's
+        # virtual time, and no earlier than the client's previous run ends
+        start_tag = max(queue.virtual_time, queue.last_tags.get(client, 0.0))
+        queue.last_tags[client] = start_tag + 1 / self.client_weights.get(client, 1.0)
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(client, lane, start_tag, future)
+        queue.waiting.setdefault(client, deque()).append(waiter)
+        return waiter
+
+    def _remove(self, waiter: _Waiter) -> None:
+        queue = self._lanes[waiter.lane]
+        pending = queue.waiting.get(waiter.client)
+        if pending is None:
+            return
+        try:
+            pending.remove(waiter)
+        except ValueError:
+            pass
+        if not pending:
+            del queue.waiting[waiter.client]
+
+    def _release(self, client: str) -> None:
+        self._active -= 1
+        self.running[client] -= 1
+        if not self.running[client]:
+            del self.running[client]
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the next eligible waiters."""
+
+        while self._active < self.max_concurrency:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            self._active += 1
+            self.running[waiter.client] = self.running.get(waiter.client, 0) + 1
+            waiter.future.set_result(None)
+
+    def _next_waiter(self) -> _Waiter | None:
+        best_lane: _LaneQueue | None = None
+        best: _Waiter | None = None
+        for queue in self._lanes.values():
+            head = self._lane_head(queue)
+            if head is None:
+                continue
+            if best_lane is None or queue.pass_value < best_lane.pass_value:
+                best_lane, best = queue, head
+        if best_lane is None or best is None:
+            return None
+
+        # Stride scheduling across lanes, start-time order within the lane
+        best_lane.pass_value += 1 / best_lane.weight
+        self._pass_value = best_lane.pass_value
+        best_lane.virtual_time = max(best_lane.virtual_time, best.start_tag)
+        self._remove(best)
+        return best
+
+    def _lane_head(self, queue: _LaneQueue) -> _Waiter | None:
+        """The waiter with the lowest start tag among clients under their cap."""
+
+        head: _Waiter | None = None
+        for client, pending in queue.waiting.items():
+            if self.running.get(client, 0) >= self.max_per_client:
+                continue
+            candidate = pending[0]
+            if head is None or candidate.start_tag < head.start_tag:
+                head = candidate
+        return head
+
+
+_scheduler: FairScheduler | None = None
+
+
+def get_scheduler() -> FairScheduler:
+    """Return the process-wide scheduler, configured from the environment."""
+
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = FairScheduler.from_env()
+    return _scheduler
+
+
+__all__ = [
+    "FairScheduler",
+    "QueueFullError",
+    "QueueTimeoutError",
+    "get_scheduler",
+    "identify_client",
+]
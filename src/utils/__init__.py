@@ -1,4 +1,5 @@
 from .logger import setup_logger
 from .validation_status import ValidationStatus
+from .metrics import metrics
 
-__all__ = ["setup_logger", "ValidationStatus"]
+__all__ = ["setup_logger", "ValidationStatus", "metrics"]
@@ -0,0 +1,24 @@
+from importlib import import_module
+from typing import Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], object], list[str]]:
+    """
+    Build a package `__getattr__` (PEP 562) and `__all__` for lazy exports.
+
+    Each name is imported from its submodule on first access, so importing
+    the package does not pull in LangChain, LangGraph or DDGS.
+
+    Args:
+        package: The package's `__name__`
+        exports: Exported name to the relative module that defines it
+    """
+
+    def __getattr__(name: str) -> object:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(import_module(exports[name], package), name)
+
+    return __getattr__, list(exports)
@@ -0,0 +1,73 @@
+import logging
+import sys
+from collections import deque
+from collections.abc import Mapping
+from typing import Callable
+
+from src.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Leaf types whose getsizeof already covers everything they own
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def deep_sizeof(obj: object) -> int:
+    """
+    Approximate the bytes held by an object graph.
+
+    Shared objects are counted once; containers, `__dict__` and `__slots__`
+    are followed, classes and modules are not.
+    """
+
+    seen: set[int] = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMIC):
+            continue
+
+        if isinstance(obj, Mapping):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is not None:
+            stack.append(attrs)
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                value = getattr(obj, slot, None)
+                if value is not None:
+                    stack.append(value)
+    return size
+
+
+def report_peak_memory(peak_bytes: int) -> None:
+    """Default memory hook: log the peak and record it in the metrics."""
+
+    logger.debug(f"Peak state size: {peak_bytes / 1024:.1f} KiB")
+    metrics.observe_size("state.peak_bytes", peak_bytes)
+
+
+class MemoryTracker:
+    """Tracks the peak size of a request's state across workflow steps."""
+
+    def __init__(self, hook: Callable[[int], None] = report_peak_memory):
+        self.hook = hook
+        self.peak = 0
+
+    def observe(self, obj: object) -> int:
+        size = deep_sizeof(obj)
+        self.peak = max(self.peak, size)
+        return size
+
+    def report(self) -> None:
+        if self.peak:
+            self.hook(self.peak)
@@ -0,0 +1,80 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        average = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "total": round(self.total, 4),
+            "avg": round(average, 4),
+            "max": round(self.max, 4),
+        }
+
+
+@dataclass
+class SizeStats:
+    count: int = 0
+    total: int = 0
+    max: int = 0
+
+    def observe(self, size: int) -> None:
+        self.count += 1
+        self.total += size
+        self.max = max(self.max, size)
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "avg": self.total // self.count if self.count else 0,
+            "max": self.max,
+        }
+
+
+class Metrics:
+    """In-process counters and timings, exposed by the /metrics route."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._timings: dict[str, TimingStats] = {}
+        self._sizes: dict[str, SizeStats] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._timings.setdefault(name, TimingStats()).observe(seconds)
+
+    def observe_size(self, name: str, size: int) -> None:
+        with self._lock:
+            self._sizes.setdefault(name, SizeStats()).observe(size)
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "timings": {
+                    name: stats.snapshot() for name, stats in self._timings.items()
+                },
+                "sizes": {
+                    name: stats.snapshot() for name, stats in self._sizes.items()
+                },
+            }
+
+
+metrics = Metrics()
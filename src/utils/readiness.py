@@ -0,0 +1,41 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Readiness:
+    """Tracks whether the service is warmed up and accepting traffic."""
+
+    ready: bool = False
+    draining: bool = False
+    error: str | None = None
+    warmup_seconds: float | None = None
+
+    @property
+    def status(self) -> str:
+        if self.draining:
+            return "draining"
+        if self.error is not None:
+            return "failed"
+        return "ready" if self.ready else "warming"
+
+    async def warm_up(self, warm: Callable[[], object]) -> None:
+        """Run a blocking warm-up function in a thread and flip to ready."""
+
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(warm)
+        except Exception as e:
+            logger.error(f"Warm-up failed: {e}")
+            self.error = str(e)
+            return
+        self.warmup_seconds = time.perf_counter() - start
+        self.ready = True
+
+
+readiness = Readiness()
@@ -82,22 +82,18 @@ function performStreamSearch() {
         currentStream = null;
     }
 }
-let lastLogCount = 0; // Track displayed logs to show only new ones
 
 function displayStreamEvent(eventData, streamingDiv) {
     if (eventData.event_type === 'started') {
         streamingDiv.innerHTML += `<div>🚀 Starting search for: ${eventData.data.query}</div><div></div>`;
-        lastLogCount = 0; // Reset counter
     } else if (eventData.event_type === 'node_completed') {
         const data = eventData.data;
 
-        // Display only new execution logs since last update
-        if (data.execution_log && data.execution_log.length > lastLogCount) {
-            const newLogs = data.execution_log.slice(lastLogCount);
-            newLogs.forEach(log => {
+        // Each event carries only the log entries added since the previous one
+        if (data.execution_log) {
+            data.execution_log.forEach(log => {
                 streamingDiv.innerHTML += `<div>${log}</div>`;
             });
-            lastLogCount = data.execution_log.length;
         }
 
         // Show plan steps only once when generate_plan completes